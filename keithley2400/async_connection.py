@@ -0,0 +1,86 @@
+"""Layer 1 (async): asyncio wrapper for concurrent multi-instrument use."""
+
+from __future__ import annotations
+
+import asyncio
+
+from .connection import Connection
+
+
+class AsyncConnection:
+    """Async facade over :class:`Connection`.
+
+    Every blocking VISA call is off-loaded to a worker thread with
+    ``asyncio.to_thread``, so while one instrument sits in a long
+    ``:READ?`` integration the event loop can service others.  The
+    synchronous API remains fully intact -- either wrap an existing
+    ``Connection`` or let this class open one.
+
+    Usage::
+
+        async with AsyncConnection("GPIB0::24::INSTR") as conn:
+            idn = await conn.identify()
+
+    A callback-based VISA event path could avoid the worker threads
+    entirely; ``to_thread`` is the pragmatic first rung.
+    """
+
+    def __init__(
+        self,
+        resource_string: str = "GPIB0::24::INSTR",
+        timeout_ms: int = 10_000,
+        connection: Connection | None = None,
+    ) -> None:
+        self._conn = connection or Connection(resource_string, timeout_ms)
+
+    # -- core I/O --------------------------------------------------------
+
+    async def write(self, cmd: str) -> None:
+        """Send a SCPI command string."""
+        await asyncio.to_thread(self._conn.write, cmd)
+
+    async def write_many(self, *cmds: str) -> None:
+        """Send several SCPI commands as one compound message."""
+        await asyncio.to_thread(self._conn.write_many, *cmds)
+
+    async def query(self, cmd: str) -> str:
+        """Send a SCPI query and return the stripped response string."""
+        return await asyncio.to_thread(self._conn.query, cmd)
+
+    async def query_ascii_values(
+        self, cmd: str, separator: str = ","
+    ) -> list[float]:
+        """Query and parse a comma-separated numeric response."""
+        return await asyncio.to_thread(
+            self._conn.query_ascii_values, cmd, separator
+        )
+
+    # -- common IEEE-488 commands ----------------------------------------
+
+    async def reset(self) -> None:
+        """``*RST`` -- restore GPIB defaults."""
+        await asyncio.to_thread(self._conn.reset)
+
+    async def clear_status(self) -> None:
+        """``*CLS`` -- clear status registers and error queue."""
+        await asyncio.to_thread(self._conn.clear_status)
+
+    async def identify(self) -> str:
+        """``*IDN?`` -- return manufacturer, model, serial, firmware."""
+        return await asyncio.to_thread(self._conn.identify)
+
+    async def operation_complete(self) -> bool:
+        """``*OPC?`` -- block until all pending operations complete."""
+        return await asyncio.to_thread(self._conn.operation_complete)
+
+    # -- lifecycle -------------------------------------------------------
+
+    async def close(self) -> None:
+        """Close the VISA session."""
+        await asyncio.to_thread(self._conn.close)
+
+    async def __aenter__(self) -> AsyncConnection:
+        return self
+
+    async def __aexit__(self, *exc) -> None:
+        await self.close()
@@ -7,23 +7,29 @@ from typing import TYPE_CHECKING
 if TYPE_CHECKING:
     from .connection import Connection
 
+# Parameter-free commands pre-encoded once, sent via write_raw
+_CMD_OUTP_ON = b":OUTP ON\n"
+_CMD_OUTP_OFF = b":OUTP OFF\n"
+
 
 class Config:
     """Instrument-level configuration that doesn't belong to source or measure."""
 
+    __slots__ = ("_conn",)
+
     def __init__(self, conn: Connection) -> None:
         self._conn = conn
 
     # -- output control (:OUTPut) ----------------------------------------
 
     def output_on(self) -> None:
-        self._conn.write(":OUTP ON")
+        self._conn.write_raw(_CMD_OUTP_ON)
 
     def output_off(self) -> None:
-        self._conn.write(":OUTP OFF")
+        self._conn.write_raw(_CMD_OUTP_OFF)
 
     def is_output_on(self) -> bool:
-        return self._conn.query(":OUTP?") == "1"
+        return self._conn.query_bool(":OUTP?")
 
     def set_output_off_mode(self, mode: str) -> None:
         """Set output-off state.
@@ -62,7 +68,7 @@ class Config:
         self._conn.write(f":SYST:RSEN {state}")
 
     def is_four_wire(self) -> bool:
-        return self._conn.query(":SYST:RSEN?") == "1"
+        return self._conn.query_bool(":SYST:RSEN?")
 
     # -- auto zero (:SYSTem:AZERo) ---------------------------------------
 
@@ -118,4 +124,4 @@ class Config:
         self._conn.write(f":SYST:BEEP:STAT {state}")
 
     def is_beeper_on(self) -> bool:
-        return self._conn.query(":SYST:BEEP:STAT?") == "1"
+        return self._conn.query_bool(":SYST:BEEP:STAT?")
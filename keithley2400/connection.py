@@ -2,7 +2,38 @@
 
 from __future__ import annotations
 
+import time
+from contextlib import contextmanager
+from typing import Iterator
+
 import pyvisa
+from pyvisa import constants
+
+# Queries that must never be memoized: IEEE-488 common queries
+# (*OPC?/*ESR? have read-and-clear or barrier semantics), measurement
+# triggers, buffer drains, the error queue, and the status registers.
+# Everything else is a plain configuration getter and safe to cache.
+_UNCACHEABLE_PREFIXES = (
+    "*",
+    ":READ",
+    ":FETC",
+    ":MEAS",
+    ":TRAC:DATA",
+    ":SYST:ERR",
+    ":STAT",
+)
+
+# Lazily created ResourceManager shared by every Connection that is not
+# given an explicit one -- VISA backend attach is slow (seconds on some
+# NI-VISA installs), so multi-instrument rigs should pay it once.
+_DEFAULT_RM: pyvisa.ResourceManager | None = None
+
+
+def _get_default_rm() -> pyvisa.ResourceManager:
+    global _DEFAULT_RM
+    if _DEFAULT_RM is None:
+        _DEFAULT_RM = pyvisa.ResourceManager()
+    return _DEFAULT_RM
 
 
 class Connection:
@@ -13,44 +44,251 @@ class Connection:
     in a mock for unit testing.
     """
 
+    __slots__ = (
+        "_rm",
+        "_inst",
+        "_qcache",
+        "_cache_ttl",
+        "_pipeline_buf",
+        "dirty",
+        "programmed",
+    )
+
     def __init__(
         self,
         resource_string: str,
         timeout_ms: int = 10_000,
         resource_manager: pyvisa.ResourceManager | None = None,
+        chunk_size: int = 1_048_576,
     ) -> None:
-        self._rm = resource_manager or pyvisa.ResourceManager()
+        self._rm = resource_manager or _get_default_rm()
         self._inst = self._rm.open_resource(resource_string)
         self._inst.timeout = timeout_ms
+        # Large chunk so a full buffer read is one low-level transfer
+        self._inst.chunk_size = chunk_size
         # Keithley 2400 uses \n as the read/write terminator
         self._inst.read_termination = "\n"
         self._inst.write_termination = "\n"
+        # Opt-in cache for idempotent query responses (see enable_cache)
+        self._qcache: dict[str, tuple[float, str]] = {}
+        self._cache_ttl = 0.0
+        # Non-None while inside a pipeline() block
+        self._pipeline_buf: list[str] | None = None
+        # True whenever a command has been written since the last *RST
+        # (state unknown at connect) -- see Keithley2400.ensure_clean
+        self.dirty = True
+        # Last value written per SCPI header, shared by the dedup
+        # helpers (Keithley2400._changed_only, Sweep._dedupe) so writes
+        # from any sub-module stay visible to all of them; cleared by
+        # *RST
+        self.programmed: dict[str, str] = {}
+
+    # -- write pipelining ------------------------------------------------
+
+    @contextmanager
+    def pipeline(self) -> Iterator[None]:
+        """Defer writes in the block, flushing them as one message.
+
+        Setter calls on any sub-module inside the block are queued
+        instead of hitting the bus, then sent as a single compound
+        transaction on exit::
+
+            with smu.conn.pipeline():
+                smu.source.set_voltage(1.0)
+                smu.measure.set_current_compliance(0.1)
+                smu.config.output_on()
+
+        A query inside the block flushes the pending writes first, so
+        command ordering is preserved.
+        """
+        if self._pipeline_buf is not None:
+            raise RuntimeError("pipeline() blocks cannot be nested")
+        self._pipeline_buf = []
+        try:
+            yield
+        finally:
+            buf, self._pipeline_buf = self._pipeline_buf, None
+            if buf:
+                self.write_many(*buf)
+
+    def _flush_pipeline(self) -> None:
+        """Send queued pipeline writes before a query goes out."""
+        buf = self._pipeline_buf
+        if buf:
+            self._pipeline_buf = None
+            self.write_many(*buf)
+            self._pipeline_buf = []
+
+    # -- query cache -----------------------------------------------------
+
+    def enable_cache(self, ttl_s: float) -> None:
+        """Cache query responses for ``ttl_s`` seconds.
+
+        Repeated ``get_*``/``is_*`` reads within the TTL are served
+        from memory instead of the bus.  Only configuration getters
+        are memoized -- measurement, status-register, error-queue and
+        IEEE-488 common queries always hit the bus (see
+        ``_UNCACHEABLE_PREFIXES``).  Any ``write`` to the same
+        subsystem invalidates the matching cached queries, so setters
+        stay consistent with getters.  Disabled by default.
+        """
+        self._cache_ttl = ttl_s
+        if ttl_s <= 0.0:
+            self._qcache.clear()
+
+    def invalidate_cache(self) -> None:
+        """Drop all cached query responses."""
+        self._qcache.clear()
+
+    def _invalidate(self, cmd: str) -> None:
+        """Invalidate cached queries touched by a command write."""
+        if not self._qcache:
+            return
+        header = cmd.split(" ", 1)[0]
+        # ":SOUR:VOLT:LEV 5" invalidates every ":SOUR:VOLT..." query
+        prefix = header.rsplit(":", 1)[0] or header
+        for key in [k for k in self._qcache if k.startswith(prefix)]:
+            del self._qcache[key]
+
+    def _record(self, cmd: str) -> None:
+        """Track the value a command write leaves on the instrument."""
+        header, _, value = cmd.partition(" ")
+        if not header.endswith("?"):
+            self.programmed[header] = value
 
     # -- core I/O --------------------------------------------------------
 
     def write(self, cmd: str) -> None:
         """Send a SCPI command string."""
+        if self._pipeline_buf is not None:
+            self._pipeline_buf.append(cmd)
+            return
+        self._invalidate(cmd)
+        self._record(cmd)
+        self.dirty = True
         self._inst.write(cmd)
 
+    def write_raw(self, raw: bytes) -> None:
+        """Send pre-encoded bytes (terminator included) as-is.
+
+        Fixed commands encoded once at import skip pyvisa's per-call
+        str-to-bytes encode and terminator append.
+        """
+        if self._pipeline_buf is not None:
+            self._pipeline_buf.append(raw.decode("ascii").rstrip("\n"))
+            return
+        if self._qcache:
+            self._invalidate(raw.decode("ascii").rstrip("\n"))
+        if self.programmed:
+            # Forget (rather than decode and record) the header -- the
+            # conservative direction keeps the dedup helpers correct
+            # without paying a full decode on the pre-encoded hot path
+            header = raw.split(b" ", 1)[0].rstrip(b"\n").decode("ascii")
+            self.programmed.pop(header, None)
+        self.dirty = True
+        self._inst.write_raw(raw)
+
+    def write_bytes(self, buf: bytes) -> None:
+        """Send a pre-encoded command, appending the terminator.
+
+        Lets callers keep fixed command prefixes as module-level
+        ``bytes`` templates and interpolate only the numeric tail,
+        skipping pyvisa's per-call str-to-bytes encode.
+        """
+        self.write_raw(buf + b"\n")
+
+    def write_many(self, *cmds: str) -> None:
+        """Send several SCPI commands as one ``;``-separated message.
+
+        The instrument parses a compound message in a single
+        transaction, so N commands cost one bus round-trip instead
+        of N.
+        """
+        if self._pipeline_buf is not None:
+            self._pipeline_buf.extend(cmds)
+            return
+        for cmd in cmds:
+            self._invalidate(cmd)
+            self._record(cmd)
+        self.dirty = True
+        self._inst.write(";".join(cmds))
+
     def query(self, cmd: str) -> str:
         """Send a SCPI query and return the stripped response string."""
-        return self._inst.query(cmd).strip()
+        self._flush_pipeline()
+        ttl = self._cache_ttl
+        cacheable = ttl > 0.0 and not cmd.startswith(_UNCACHEABLE_PREFIXES)
+        if cacheable:
+            hit = self._qcache.get(cmd)
+            if hit is not None and time.monotonic() - hit[0] < ttl:
+                return hit[1]
+        resp = self._inst.query(cmd).strip()
+        if cacheable:
+            self._qcache[cmd] = (time.monotonic(), resp)
+        return resp
+
+    def query_bool(self, cmd: str) -> bool:
+        """Query a 0/1 predicate.
+
+        Goes through :meth:`query` so predicates polled in tight loops
+        benefit from the TTL cache like any other getter.
+        """
+        return self.query(cmd)[:1] == "1"
 
     def query_ascii_values(
-        self, cmd: str, separator: str = ","
+        self, cmd: str, separator: str = ",", container: type = list
     ) -> list[float]:
-        """Query and parse a comma-separated numeric response."""
-        return self._inst.query_ascii_values(cmd, separator=separator)
+        """Query and parse a comma-separated numeric response.
+
+        Pass ``container=numpy.array`` to skip the Python ``float``
+        boxing on large transfers.
+        """
+        self._flush_pipeline()
+        if ";" in cmd:
+            # Compound message: the embedded setters program the
+            # instrument like any write would
+            for part in cmd.split(";"):
+                if self._qcache:
+                    self._invalidate(part)
+                self._record(part)
+            self.dirty = True
+        return self._inst.query_ascii_values(
+            cmd, separator=separator, container=container
+        )
+
+    def query_binary_values(
+        self,
+        cmd: str,
+        datatype: str = "f",
+        container: type = list,
+        is_big_endian: bool = False,
+    ) -> list[float]:
+        """Query an IEEE-488.2 definite-length binary block.
+
+        Requires the instrument to be in a binary data format
+        (``:FORM:DATA REAL,32`` or ``REAL,64``).
+        """
+        self._flush_pipeline()
+        return self._inst.query_binary_values(
+            cmd,
+            datatype=datatype,
+            container=container,
+            is_big_endian=is_big_endian,
+        )
 
     # -- common IEEE-488 commands ----------------------------------------
 
     def reset(self) -> None:
         """``*RST`` -- restore GPIB defaults."""
-        self.write("*RST")
+        self.invalidate_cache()
+        self.write_raw(b"*RST\n")
+        self.programmed.clear()
+        self.dirty = False
 
     def clear_status(self) -> None:
         """``*CLS`` -- clear status registers and error queue."""
-        self.write("*CLS")
+        self.invalidate_cache()
+        self.write_raw(b"*CLS\n")
 
     def identify(self) -> str:
         """``*IDN?`` -- return manufacturer, model, serial, firmware."""
@@ -62,7 +300,34 @@ class Connection:
 
     def wait(self) -> None:
         """``*WAI`` -- wait-to-continue."""
-        self.write("*WAI")
+        self.write_raw(b"*WAI\n")
+
+    def wait_for_opc_event(self, timeout_ms: int | None = None) -> None:
+        """Block on a service-request event until operations complete.
+
+        Arms ``*OPC`` through the event-summary and service-request
+        enable registers, then sleeps on the VISA SRQ event instead of
+        spinning on a synchronous ``*OPC?`` query -- the bus (and the
+        GIL) are free while the instrument works.
+        """
+        self._inst.enable_event(
+            constants.EventType.service_request,
+            constants.EventMechanism.queue,
+        )
+        try:
+            self.write("*ESE 1")   # OPC bit -> event summary
+            self.write("*SRE 32")  # ESB -> service request
+            self.write("*OPC")
+            self._inst.wait_on_event(
+                constants.EventType.service_request,
+                timeout_ms if timeout_ms is not None else self._inst.timeout,
+            )
+            self._inst.read_stb()  # clear the SRQ
+        finally:
+            self._inst.disable_event(
+                constants.EventType.service_request,
+                constants.EventMechanism.queue,
+            )
 
     def self_test(self) -> int:
         """``*TST?`` -- run self-test; returns 0 on pass."""
@@ -74,6 +339,14 @@ class Connection:
         """Close the VISA session."""
         self._inst.close()
 
+    @staticmethod
+    def shutdown_default_rm() -> None:
+        """Close the shared default ResourceManager (test teardown)."""
+        global _DEFAULT_RM
+        if _DEFAULT_RM is not None:
+            _DEFAULT_RM.close()
+            _DEFAULT_RM = None
+
     def __enter__(self) -> Connection:
         return self
 
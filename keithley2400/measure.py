@@ -7,12 +7,29 @@ from typing import TYPE_CHECKING
 if TYPE_CHECKING:
     from .connection import Connection
 
+# Numeric command templates (see source.py) -- avoids re-parsing the
+# format spec on every compliance/range write.
+_CMD_VOLT_PROT = b":SENS:VOLT:PROT %.7g"
+_CMD_CURR_PROT = b":SENS:CURR:PROT %.7g"
+_CMD_VOLT_RANG = b":SENS:VOLT:RANG %.7g"
+_CMD_CURR_RANG = b":SENS:CURR:RANG %.7g"
+_CMD_RES_RANG = b":SENS:RES:RANG %.7g"
+
 
 class Measure:
     """Configure measurement functions and acquire readings."""
 
+    __slots__ = ("_conn", "_last_meas_func")
+
     def __init__(self, conn: Connection) -> None:
         self._conn = conn
+        # Sense function programmed by the last measure(func) call
+        self._last_meas_func: str | None = None
+
+    def invalidate(self) -> None:
+        """Forget the cached sense function (call after *RST or
+        external ``:SENS:FUNC`` writes)."""
+        self._last_meas_func = None
 
     # -- function selection ----------------------------------------------
 
@@ -25,8 +42,10 @@ class Measure:
             ``"VOLT"`` / ``"VOLT:DC"``, ``"CURR"`` / ``"CURR:DC"``,
             ``"RES"`` / ``"RES"``.
         """
-        func_list = ",".join(f'"{f}"' for f in funcs)
+        func_list = ",".join([f'"{f}"' for f in funcs])
         self._conn.write(f":SENS:FUNC {func_list}")
+        # Out-of-band function change -- measure(func) must reconfigure
+        self.invalidate()
 
     def get_function(self) -> str:
         return self._conn.query(":SENS:FUNC?")
@@ -37,46 +56,46 @@ class Measure:
         self._conn.write(f":SENS:FUNC:CONC {state}")
 
     def is_concurrent(self) -> bool:
-        return self._conn.query(":SENS:FUNC:CONC?") == "1"
+        return self._conn.query_bool(":SENS:FUNC:CONC?")
 
     # -- compliance (protection) -----------------------------------------
 
     def set_voltage_compliance(self, volts: float) -> None:
         """Set voltage compliance limit for I-source."""
-        self._conn.write(f":SENS:VOLT:PROT {volts:E}")
+        self._conn.write_bytes(_CMD_VOLT_PROT % volts)
 
     def get_voltage_compliance(self) -> float:
         return float(self._conn.query(":SENS:VOLT:PROT?"))
 
     def is_voltage_compliance_tripped(self) -> bool:
-        return self._conn.query(":SENS:VOLT:PROT:TRIP?") == "1"
+        return self._conn.query_bool(":SENS:VOLT:PROT:TRIP?")
 
     def set_current_compliance(self, amps: float) -> None:
         """Set current compliance limit for V-source."""
-        self._conn.write(f":SENS:CURR:PROT {amps:E}")
+        self._conn.write_bytes(_CMD_CURR_PROT % amps)
 
     def get_current_compliance(self) -> float:
         return float(self._conn.query(":SENS:CURR:PROT?"))
 
     def is_current_compliance_tripped(self) -> bool:
-        return self._conn.query(":SENS:CURR:PROT:TRIP?") == "1"
+        return self._conn.query_bool(":SENS:CURR:PROT:TRIP?")
 
     # -- range -----------------------------------------------------------
 
     def set_voltage_range(self, range_val: float) -> None:
-        self._conn.write(f":SENS:VOLT:RANG {range_val:E}")
+        self._conn.write_bytes(_CMD_VOLT_RANG % range_val)
 
     def get_voltage_range(self) -> float:
         return float(self._conn.query(":SENS:VOLT:RANG?"))
 
     def set_current_range(self, range_val: float) -> None:
-        self._conn.write(f":SENS:CURR:RANG {range_val:E}")
+        self._conn.write_bytes(_CMD_CURR_RANG % range_val)
 
     def get_current_range(self) -> float:
         return float(self._conn.query(":SENS:CURR:RANG?"))
 
     def set_resistance_range(self, range_val: float) -> None:
-        self._conn.write(f":SENS:RES:RANG {range_val:E}")
+        self._conn.write_bytes(_CMD_RES_RANG % range_val)
 
     def set_auto_range(self, func: str, enable: bool) -> None:
         """Enable/disable auto range for a function.
@@ -124,10 +143,13 @@ class Measure:
         count : int
             Filter count (1 to 100).
         """
-        self._conn.write(f":SENS:AVER:TCON {filter_type}")
-        self._conn.write(f":SENS:AVER:COUN {count}")
         state = "ON" if enable else "OFF"
-        self._conn.write(f":SENS:AVER {state}")
+        # One compound message with tree-relative headers: after the
+        # first command the SCPI parser stays at the :SENS:AVER node,
+        # so COUN/STAT resolve without repeating the full path
+        self._conn.write(
+            f":SENS:AVER:TCON {filter_type};COUN {count};STAT {state}"
+        )
 
     # -- acquire readings ------------------------------------------------
 
@@ -135,21 +157,36 @@ class Measure:
         """:READ? -- trigger a measurement and return readings."""
         return self._conn.query_ascii_values(":READ?")
 
+    def read_binary(self) -> list[float]:
+        """:READ? -- trigger a measurement, reading a REAL,64 block.
+
+        The instrument must already be in binary format
+        (``:FORM:DATA REAL,64``); the sweep routines arrange this when
+        called with ``binary=True``.
+        """
+        return self._conn.query_binary_values(":READ?", datatype="d")
+
     def fetch(self) -> list[float]:
         """:FETC? -- return the most recent readings (no trigger)."""
         return self._conn.query_ascii_values(":FETC?")
 
     def measure(self, func: str | None = None) -> list[float]:
-        """:MEAS? -- one-shot configure + read.
+        """Configure the sense function (once) and read.
 
         Parameters
         ----------
         func : str or None
-            If given, one of ``"VOLT"``, ``"CURR"``, ``"RES"``.
-            If *None*, uses the currently configured function.
+            If given, one of ``"VOLT"``, ``"CURR"``, ``"RES"``.  The
+            function is programmed only when it differs from the
+            previous call, so a measurement loop pays one ``:READ?``
+            per iteration instead of a full ``:MEAS:<func>?``
+            reconfigure cycle.
+            If *None*, issues a bare ``:MEAS?`` with the current
+            configuration.
         """
         if func:
-            cmd = f":MEAS:{func}?"
-        else:
-            cmd = ":MEAS?"
-        return self._conn.query_ascii_values(cmd)
+            if func != self._last_meas_func:
+                self._conn.write(f':SENS:FUNC "{func}"')
+                self._last_meas_func = func
+            return self._conn.query_ascii_values(":READ?")
+        return self._conn.query_ascii_values(":MEAS?")
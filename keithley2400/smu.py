@@ -2,6 +2,8 @@
 
 from __future__ import annotations
 
+from functools import cached_property
+
 from .config import Config
 from .connection import Connection
 from .data import DataBuffer
@@ -27,15 +29,41 @@ class Keithley2400:
         self,
         resource_string: str = "GPIB0::24::INSTR",
         timeout_ms: int = 10_000,
+        chunk_size: int = 1_048_576,
     ) -> None:
-        self.conn = Connection(resource_string, timeout_ms)
-        self.config = Config(self.conn)
-        self.source = Source(self.conn)
-        self.measure = Measure(self.conn)
-        self.trigger = Trigger(self.conn)
-        self.buffer = DataBuffer(self.conn)
-        self.status = Status(self.conn)
-        self.sweep = Sweep(
+        # chunk_size is forwarded to the VISA session; the 1 MB default
+        # lets a full buffer/sweep readback arrive in one low-level read
+        self.conn = Connection(resource_string, timeout_ms, chunk_size=chunk_size)
+
+    # -- sub-modules (built lazily on first access) ----------------------
+
+    @cached_property
+    def config(self) -> Config:
+        return Config(self.conn)
+
+    @cached_property
+    def source(self) -> Source:
+        return Source(self.conn)
+
+    @cached_property
+    def measure(self) -> Measure:
+        return Measure(self.conn)
+
+    @cached_property
+    def trigger(self) -> Trigger:
+        return Trigger(self.conn)
+
+    @cached_property
+    def buffer(self) -> DataBuffer:
+        return DataBuffer(self.conn)
+
+    @cached_property
+    def status(self) -> Status:
+        return Status(self.conn)
+
+    @cached_property
+    def sweep(self) -> Sweep:
+        return Sweep(
             self.conn,
             self.source,
             self.measure,
@@ -48,11 +76,65 @@ class Keithley2400:
     def reset(self) -> None:
         """``*RST`` -- restore GPIB default settings."""
         self.conn.reset()
+        self.invalidate()
+
+    def invalidate(self) -> None:
+        """Drop every driver-side cache of instrument state.
+
+        The per-header write tracking on the shared connection keeps
+        the dedup helpers coherent across sub-modules, but it cannot
+        see state changed outside the driver (front-panel operation,
+        a power cycle, raw byte writes); call this afterwards so the
+        next command reconfigures from scratch.  ``reset`` calls it
+        automatically.
+        """
+        self.conn.programmed.clear()
+        # Only sub-modules that were lazily created hold caches
+        if "trigger" in self.__dict__:
+            self.trigger.invalidate()
+        if "measure" in self.__dict__:
+            self.measure.invalidate()
+        if "sweep" in self.__dict__:
+            self.sweep.invalidate()
+
+    def ensure_clean(self) -> None:
+        """Reset only if the instrument state may have drifted.
+
+        A ``*RST`` costs a bus round-trip plus settling; when nothing
+        has been written since the last reset there is nothing to
+        undo, so this is a no-op.  The connection marks itself dirty
+        on every command write, whichever sub-module sent it.
+        """
+        if self.conn.dirty:
+            self.reset()
 
     def identify(self) -> str:
         """``*IDN?`` -- query instrument identification."""
         return self.conn.identify()
 
+    def wait_complete(self, timeout_ms: int | None = None) -> None:
+        """Block until pending operations finish, using an SRQ event
+        rather than polling ``*OPC?``."""
+        self.conn.wait_for_opc_event(timeout_ms)
+
+    def _changed_only(self, *cmds: str) -> list[str]:
+        """Drop commands whose header already holds the same value.
+
+        Counterpart of ``Sweep._dedupe`` for the fixed-level paths.
+        Reads the per-header write tracking on the shared connection,
+        so configuration changed by any sub-module (the sweep runner's
+        *RST and reprogramming included) is re-sent rather than
+        wrongly elided; the kept commands are recorded when the
+        compound message goes out.
+        """
+        last = self.conn.programmed
+        out = []
+        for cmd in cmds:
+            header, _, value = cmd.partition(" ")
+            if last.get(header) != value:
+                out.append(cmd)
+        return out
+
     def source_voltage(
         self,
         volts: float,
@@ -76,15 +158,19 @@ class Keithley2400:
             Reading(s) as returned by ``:READ?`` with the currently
             configured ``:FORM:ELEM``.
         """
-        self.source.set_function("VOLT")
-        self.source.set_voltage_mode("FIX")
-        self.source.set_voltage(volts)
-        self.measure.set_current_compliance(compliance)
-        self.measure.set_function(measure)
-        self.config.output_on()
-        data = self.measure.read()
-        self.config.output_off()
-        return data
+        # One compound message: the reply to the embedded :READ? comes
+        # back on the same transaction, saving a bus turnaround.
+        # Configuration the instrument already holds is elided, so a
+        # repeat-call loop shrinks to :OUTP ON;:READ?;:OUTP OFF.
+        setup = self._changed_only(
+            ":SOUR:FUNC VOLT",
+            ":SOUR:VOLT:MODE FIX",
+            f":SOUR:VOLT:LEV {volts:E}",
+            f":SENS:CURR:PROT {compliance:E}",
+            f':SENS:FUNC "{measure}"',
+        )
+        compound = ";".join((*setup, ":OUTP ON", ":READ?", ":OUTP OFF"))
+        return self.conn.query_ascii_values(compound)
 
     def source_current(
         self,
@@ -108,15 +194,70 @@ class Keithley2400:
         list[float]
             Reading(s) as returned by ``:READ?``.
         """
-        self.source.set_function("CURR")
-        self.source.set_current_mode("FIX")
-        self.source.set_current(amps)
-        self.measure.set_voltage_compliance(compliance)
-        self.measure.set_function(measure)
-        self.config.output_on()
-        data = self.measure.read()
+        setup = self._changed_only(
+            ":SOUR:FUNC CURR",
+            ":SOUR:CURR:MODE FIX",
+            f":SOUR:CURR:LEV {amps:E}",
+            f":SENS:VOLT:PROT {compliance:E}",
+            f':SENS:FUNC "{measure}"',
+        )
+        compound = ";".join((*setup, ":OUTP ON", ":READ?", ":OUTP OFF"))
+        return self.conn.query_ascii_values(compound)
+
+    def source_voltage_batch(
+        self,
+        volts_list: list[float],
+        compliance: float,
+        measure: str = "CURR",
+    ) -> list[list[float]]:
+        """Source a sequence of fixed voltages, measuring at each level.
+
+        The loop-invariant configuration is sent once; each point then
+        costs a single ``:SOUR:VOLT:LEV ...;:READ?`` transaction.  For
+        sweeps paced entirely by the instrument, see :class:`Sweep`.
+
+        Returns
+        -------
+        list[list[float]]
+            One ``:READ?`` reading list per level.
+        """
+        self.conn.write_many(
+            ":SOUR:FUNC VOLT",
+            ":SOUR:VOLT:MODE FIX",
+            f":SENS:CURR:PROT {compliance:E}",
+            f':SENS:FUNC "{measure}"',
+            ":OUTP ON",
+        )
+        results = [
+            self.conn.query_ascii_values(f":SOUR:VOLT:LEV {v:E};:READ?")
+            for v in volts_list
+        ]
+        self.config.output_off()
+        return results
+
+    def source_current_batch(
+        self,
+        amps_list: list[float],
+        compliance: float,
+        measure: str = "VOLT",
+    ) -> list[list[float]]:
+        """Source a sequence of fixed currents, measuring at each level.
+
+        Counterpart of :meth:`source_voltage_batch`.
+        """
+        self.conn.write_many(
+            ":SOUR:FUNC CURR",
+            ":SOUR:CURR:MODE FIX",
+            f":SENS:VOLT:PROT {compliance:E}",
+            f':SENS:FUNC "{measure}"',
+            ":OUTP ON",
+        )
+        results = [
+            self.conn.query_ascii_values(f":SOUR:CURR:LEV {a:E};:READ?")
+            for a in amps_list
+        ]
         self.config.output_off()
-        return data
+        return results
 
     # -- lifecycle -------------------------------------------------------
 
@@ -2,15 +2,40 @@
 
 from __future__ import annotations
 
+from functools import lru_cache
 from typing import TYPE_CHECKING
 
 if TYPE_CHECKING:
     from .connection import Connection
 
+# Pre-encoded numeric command templates -- "%"-formatting on bytes
+# skips per-call format-spec parsing and the str-to-bytes encode in
+# the setter hot path;
+# "%.7g" covers the 2400's 6.5-digit resolution while emitting "10"
+# instead of "1.000000E+01", keeping compound messages short.
+_CMD_VOLT_LEV = b":SOUR:VOLT:LEV %.7g"
+_CMD_VOLT_RANG = b":SOUR:VOLT:RANG %.7g"
+_CMD_VOLT_PROT = b":SOUR:VOLT:PROT %.7g"
+_CMD_CURR_LEV = b":SOUR:CURR:LEV %.7g"
+_CMD_CURR_RANG = b":SOUR:CURR:RANG %.7g"
+
+
+@lru_cache(maxsize=256)
+def _fmt(template: bytes, value: float) -> bytes:
+    """Memoized numeric interpolation.
+
+    Stepped bias loops revisit the same few levels over and over; the
+    cache returns the previously built message instead of re-running
+    the float formatter.
+    """
+    return template % value
+
 
 class Source:
     """Configure the voltage or current source."""
 
+    __slots__ = ("_conn",)
+
     def __init__(self, conn: Connection) -> None:
         self._conn = conn
 
@@ -33,13 +58,13 @@ class Source:
 
     def set_voltage(self, level: float) -> None:
         """Set V-source amplitude (volts)."""
-        self._conn.write(f":SOUR:VOLT:LEV {level:E}")
+        self._conn.write_bytes(_fmt(_CMD_VOLT_LEV, level))
 
     def get_voltage(self) -> float:
         return float(self._conn.query(":SOUR:VOLT:LEV?"))
 
     def set_voltage_range(self, range_val: float) -> None:
-        self._conn.write(f":SOUR:VOLT:RANG {range_val:E}")
+        self._conn.write_bytes(_fmt(_CMD_VOLT_RANG, range_val))
 
     def get_voltage_range(self) -> float:
         return float(self._conn.query(":SOUR:VOLT:RANG?"))
@@ -61,13 +86,13 @@ class Source:
 
     def set_current(self, level: float) -> None:
         """Set I-source amplitude (amps)."""
-        self._conn.write(f":SOUR:CURR:LEV {level:E}")
+        self._conn.write_bytes(_fmt(_CMD_CURR_LEV, level))
 
     def get_current(self) -> float:
         return float(self._conn.query(":SOUR:CURR:LEV?"))
 
     def set_current_range(self, range_val: float) -> None:
-        self._conn.write(f":SOUR:CURR:RANG {range_val:E}")
+        self._conn.write_bytes(_fmt(_CMD_CURR_RANG, range_val))
 
     def get_current_range(self) -> float:
         return float(self._conn.query(":SOUR:CURR:RANG?"))
@@ -99,16 +124,16 @@ class Source:
         self._conn.write(f":SOUR:DEL:AUTO {state}")
 
     def is_auto_delay(self) -> bool:
-        return self._conn.query(":SOUR:DEL:AUTO?") == "1"
+        return self._conn.query_bool(":SOUR:DEL:AUTO?")
 
     # -- voltage protection (limit) --------------------------------------
 
     def set_voltage_protection(self, volts: float) -> None:
         """Set V-source protection level (hardware voltage limit)."""
-        self._conn.write(f":SOUR:VOLT:PROT {volts:E}")
+        self._conn.write_bytes(_fmt(_CMD_VOLT_PROT, volts))
 
     def get_voltage_protection(self) -> float:
         return float(self._conn.query(":SOUR:VOLT:PROT?"))
 
     def is_voltage_protection_tripped(self) -> bool:
-        return self._conn.query(":SOUR:VOLT:PROT:TRIP?") == "1"
+        return self._conn.query_bool(":SOUR:VOLT:PROT:TRIP?")
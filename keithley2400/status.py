@@ -2,15 +2,21 @@
 
 from __future__ import annotations
 
+import re
 from typing import TYPE_CHECKING
 
 if TYPE_CHECKING:
     from .connection import Connection
 
+# One <code>,"<message>" pair in a :SYST:ERR:ALL? response
+_ERR_RE = re.compile(r'(-?\d+),"([^"]*)"')
+
 
 class Status:
     """Read status registers and manage the error queue."""
 
+    __slots__ = ("_conn",)
+
     def __init__(self, conn: Connection) -> None:
         self._conn = conn
 
@@ -23,18 +29,26 @@ class Status:
         """
         resp = self._conn.query(":SYST:ERR?")
         # Response format: <code>,"<message>"
-        code_str, msg = resp.split(",", 1)
-        return int(code_str), msg.strip().strip('"')
+        code_str, _, msg = resp.partition(",")
+        msg = msg.strip()
+        if msg.startswith('"') and msg.endswith('"'):
+            msg = msg[1:-1]
+        return int(code_str), msg
 
     def read_all_errors(self) -> list[tuple[int, str]]:
-        """Drain the error queue and return all errors."""
-        errors: list[tuple[int, str]] = []
-        while True:
-            code, msg = self.read_error()
-            if code == 0:
-                break
-            errors.append((code, msg))
-        return errors
+        """Drain the error queue and return all errors.
+
+        Uses ``:SYST:ERR:ALL?`` so the whole queue comes back in one
+        bus transaction instead of one round-trip per queued error.
+        """
+        resp = self._conn.query(":SYST:ERR:ALL?")
+        # Match <code>,"<message>" pairs -- a plain split(",") would
+        # break on commas inside quoted messages.
+        return [
+            (int(code), msg)
+            for code, msg in _ERR_RE.findall(resp)
+            if int(code) != 0
+        ]
 
     # -- clear -----------------------------------------------------------
 
@@ -80,4 +94,4 @@ class Status:
 
     def preset(self) -> None:
         """:STAT:PRES -- return status registers to default states."""
-        self._conn.write(":STAT:PRES")
+        self._conn.write_raw(b":STAT:PRES\n")
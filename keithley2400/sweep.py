@@ -2,13 +2,24 @@
 
 Each method orchestrates source, measure, trigger, and config modules
 to execute a complete sweep and return parsed data.
+
+Sweep results are ``{"voltage": ..., "current": ...}`` dicts whose
+values are float64 numpy arrays (plain lists without numpy) -- 8 bytes
+per sample instead of a boxed Python float each, and ready for
+plotting/fitting without a conversion pass.
 """
 
 from __future__ import annotations
 
 import math
+import time
 from typing import TYPE_CHECKING
 
+try:
+    import numpy as np
+except ImportError:  # pragma: no cover - numpy is optional
+    np = None
+
 if TYPE_CHECKING:
     from .config import Config
     from .connection import Connection
@@ -16,10 +27,87 @@ if TYPE_CHECKING:
     from .source import Source
     from .trigger import Trigger
 
+# List sweeps at or above this many points format their setpoints
+# through numpy's C-level "%E" loop instead of per-element format().
+_NUMPY_FMT_MIN = 64
+
+# Templates bound once at import so each format spec is parsed a
+# single time instead of per sweep call
+_FMT_E = "{:E}".format
+_FMT_VSTART = ":SOUR:VOLT:START {:E}".format
+_FMT_VSTOP = ":SOUR:VOLT:STOP {:E}".format
+_FMT_VSTEP = ":SOUR:VOLT:STEP {:E}".format
+_FMT_CSTART = ":SOUR:CURR:START {:E}".format
+_FMT_CSTOP = ":SOUR:CURR:STOP {:E}".format
+_FMT_CSTEP = ":SOUR:CURR:STEP {:E}".format
+_FMT_SWE_POIN = ":SOUR:SWE:POIN {:d}".format
+_FMT_TRIG_COUN = ":TRIG:COUN {:d}".format
+_FMT_SOUR_DEL = ":SOUR:DEL {}".format
+_FMT_CURR_PROT = ":SENS:CURR:PROT {:.7g}".format
+_FMT_VOLT_PROT = ":SENS:VOLT:PROT {:.7g}".format
+_FMT_CURR_NPLC = ":SENS:CURR:NPLC {}".format
+_FMT_VOLT_NPLC = ":SENS:VOLT:NPLC {}".format
+_FMT_LIST_VOLT = ":SOUR:LIST:VOLT {}".format
+_FMT_LIST_CURR = ":SOUR:LIST:CURR {}".format
+
+
+def _sweep_points(start: float, stop: float, step: float) -> int:
+    """Point count for a linear staircase sweep.
+
+    One FP division and a sign-stripped round -- exact for the
+    decimal start/stop/step values used in practice and cheaper than
+    the abs()/abs() pair it replaces.
+    """
+    return abs(round((stop - start) / step)) + 1
+
+
+def _make_parser(key_a: str, key_b: str):
+    """Build a two-column parser with the result keys baked in.
+
+    The keys and the numpy entry points become closure constants, so
+    the per-sweep call is just reshape + two views + one dict literal
+    with no global lookups; ``Sweep._parse_vi`` is the instance built
+    once at import for the voltage/current hot path.
+    """
+    if np is None:
+        def parse(raw: list[float]) -> dict[str, list[float]]:
+            return {key_a: raw[0::2], key_b: raw[1::2]}
+
+        return parse
+
+    asarray = np.asarray
+    float64 = np.float64
+
+    def parse(raw) -> dict[str, np.ndarray]:
+        arr = asarray(raw, dtype=float64).reshape(-1, 2)
+        return {key_a: arr[:, 0], key_b: arr[:, 1]}
+
+    return parse
+
+
+def _format_setpoints(values: list[float]) -> str:
+    """Join setpoints into the comma-separated :SOUR:LIST payload."""
+    if np is not None and len(values) >= _NUMPY_FMT_MIN:
+        return ",".join(np.char.mod("%E", np.asarray(values, dtype=np.float64)))
+    # list comprehension, not a genexp: str.join materializes a
+    # sequence anyway, and the list skips the per-element generator send
+    return ",".join([_FMT_E(v) for v in values])
+
 
 class Sweep:
     """High-level sweep operations for the Keithley 2400."""
 
+    __slots__ = (
+        "_conn",
+        "_source",
+        "_measure",
+        "_trigger",
+        "_config",
+        "_last_sweep_key",
+        "_keep_output_on",
+        "_output_is_on",
+    )
+
     def __init__(
         self,
         conn: Connection,
@@ -33,6 +121,39 @@ class Sweep:
         self._measure = measure
         self._trigger = trigger
         self._config = config
+        # One-entry memo of the sweep setup currently on the instrument
+        # (per-header values live on the shared conn.programmed map)
+        self._last_sweep_key: tuple | None = None
+        # Sticky output flag (see set_keep_output_on)
+        self._keep_output_on = False
+        self._output_is_on = False
+
+    def invalidate(self) -> None:
+        """Drop the configured-sweep memo and per-command state.
+
+        Repeated calls with identical arguments skip the *RST +
+        setup batch, and back-to-back different sweeps skip commands
+        whose values are unchanged; call this after mutating
+        source/measure/config state directly so the next sweep
+        reconfigures from scratch.
+        """
+        self._last_sweep_key = None
+        self._conn.programmed.clear()
+        self._output_is_on = False
+
+    def set_keep_output_on(self, enabled: bool) -> None:
+        """Keep the output on between sweeps.
+
+        Each sweep normally toggles the output relay on and off,
+        paying relay settle time (~50-100 ms a side on the 2400) per
+        sweep.  With this enabled the output stays on after a sweep
+        and is not re-armed on the next one; disabling turns the
+        output off immediately if a sweep left it on.
+        """
+        self._keep_output_on = enabled
+        if not enabled and self._output_is_on:
+            self._config.output_off()
+            self._output_is_on = False
 
     # -- linear staircase sweeps -----------------------------------------
 
@@ -44,44 +165,72 @@ class Sweep:
         compliance: float,
         delay: float = 0.1,
         nplc: float = 1.0,
-    ) -> dict[str, list[float]]:
+        binary: bool = False,
+    ) -> dict[str, np.ndarray]:
         """Linear voltage sweep, measuring current at each point.
 
         Follows the manual's programming example (Table 10-4).
+        With ``binary=True`` the readback is transferred as a
+        ``REAL,64`` IEEE-488.2 block instead of ASCII -- roughly half
+        the bytes on the wire and no float parsing.
 
         Returns
         -------
         dict
             ``{"voltage": [...], "current": [...]}``.
         """
-        num_points = int(round(abs(stop - start) / abs(step))) + 1
-
-        self._conn.reset()
-        self._measure.set_concurrent(False)
-        self._source.set_function("VOLT")
-        self._measure.set_function("CURR:DC")
-        self._measure.set_current_compliance(compliance)
-        self._measure.set_nplc("CURR", nplc)
-
-        # Configure sweep
-        self._conn.write(f":SOUR:VOLT:START {start:E}")
-        self._conn.write(f":SOUR:VOLT:STOP {stop:E}")
-        self._conn.write(f":SOUR:VOLT:STEP {step:E}")
-        self._source.set_voltage_mode("SWE")
-        self._conn.write(":SOUR:SWE:RANG AUTO")
-        self._conn.write(":SOUR:SWE:SPAC LIN")
-        self._trigger.set_trigger_count(num_points)
-        self._source.set_delay(delay)
-
-        # Select data elements
-        self._config.set_data_elements("VOLT", "CURR")
-
-        # Execute
-        self._config.output_on()
-        raw = self._measure.read()
-        self._config.output_off()
-
-        return self._parse_two_element(raw, "voltage", "current")
+        num_points = _sweep_points(start, stop, step)
+
+        key = ("vlin", start, stop, step, compliance, delay, nplc, binary)
+
+        def make_setup() -> list[str]:
+            return [
+                ":SENS:FUNC:CONC OFF",
+                ":SOUR:FUNC VOLT",
+                ':SENS:FUNC "CURR:DC"',
+                _FMT_CURR_PROT(compliance),
+                _FMT_CURR_NPLC(nplc),
+                _FMT_VSTART(start),
+                _FMT_VSTOP(stop),
+                _FMT_VSTEP(step),
+                ":SOUR:VOLT:MODE SWE",
+                ":SOUR:SWE:RANG AUTO",
+                ":SOUR:SWE:SPAC LIN",
+                _FMT_TRIG_COUN(num_points),
+                _FMT_SOUR_DEL(delay),
+                ":FORM:ELEM VOLT,CURR",
+            ]
+
+        raw = self._run_sweep(key, make_setup, binary, num_points, delay, nplc)
+        return self._parse_vi(raw)
+
+    def voltage_sweep_linear_batch(
+        self,
+        windows: list[tuple[float, float, float]],
+        compliance: float,
+        delay: float = 0.1,
+        nplc: float = 1.0,
+        binary: bool = False,
+    ) -> list[dict[str, np.ndarray]]:
+        """Run several linear voltage sweeps back to back.
+
+        ``windows`` is a list of ``(start, stop, step)`` tuples.  The
+        shared configuration (functions, compliance, NPLC, sweep mode,
+        data elements) is programmed once; the per-command dedup in
+        the sweep runner means each subsequent window only re-sends
+        its START/STOP/STEP and trigger count before arming.
+
+        Returns
+        -------
+        list of dict
+            One ``{"voltage": [...], "current": [...]}`` per window.
+        """
+        return [
+            self.voltage_sweep_linear(
+                start, stop, step, compliance, delay, nplc, binary
+            )
+            for start, stop, step in windows
+        ]
 
     def current_sweep_linear(
         self,
@@ -91,7 +240,8 @@ class Sweep:
         compliance: float,
         delay: float = 0.1,
         nplc: float = 1.0,
-    ) -> dict[str, list[float]]:
+        binary: bool = False,
+    ) -> dict[str, np.ndarray]:
         """Linear current sweep, measuring voltage at each point.
 
         Returns
@@ -99,31 +249,30 @@ class Sweep:
         dict
             ``{"voltage": [...], "current": [...]}``.
         """
-        num_points = int(round(abs(stop - start) / abs(step))) + 1
-
-        self._conn.reset()
-        self._measure.set_concurrent(False)
-        self._source.set_function("CURR")
-        self._measure.set_function("VOLT:DC")
-        self._measure.set_voltage_compliance(compliance)
-        self._measure.set_nplc("VOLT", nplc)
-
-        self._conn.write(f":SOUR:CURR:START {start:E}")
-        self._conn.write(f":SOUR:CURR:STOP {stop:E}")
-        self._conn.write(f":SOUR:CURR:STEP {step:E}")
-        self._source.set_current_mode("SWE")
-        self._conn.write(":SOUR:SWE:RANG AUTO")
-        self._conn.write(":SOUR:SWE:SPAC LIN")
-        self._trigger.set_trigger_count(num_points)
-        self._source.set_delay(delay)
-
-        self._config.set_data_elements("VOLT", "CURR")
-
-        self._config.output_on()
-        raw = self._measure.read()
-        self._config.output_off()
-
-        return self._parse_two_element(raw, "voltage", "current")
+        num_points = _sweep_points(start, stop, step)
+
+        key = ("clin", start, stop, step, compliance, delay, nplc, binary)
+
+        def make_setup() -> list[str]:
+            return [
+                ":SENS:FUNC:CONC OFF",
+                ":SOUR:FUNC CURR",
+                ':SENS:FUNC "VOLT:DC"',
+                _FMT_VOLT_PROT(compliance),
+                _FMT_VOLT_NPLC(nplc),
+                _FMT_CSTART(start),
+                _FMT_CSTOP(stop),
+                _FMT_CSTEP(step),
+                ":SOUR:CURR:MODE SWE",
+                ":SOUR:SWE:RANG AUTO",
+                ":SOUR:SWE:SPAC LIN",
+                _FMT_TRIG_COUN(num_points),
+                _FMT_SOUR_DEL(delay),
+                ":FORM:ELEM VOLT,CURR",
+            ]
+
+        raw = self._run_sweep(key, make_setup, binary, num_points, delay, nplc)
+        return self._parse_vi(raw)
 
     # -- logarithmic staircase sweeps ------------------------------------
 
@@ -135,31 +284,31 @@ class Sweep:
         compliance: float,
         delay: float = 0.1,
         nplc: float = 1.0,
-    ) -> dict[str, list[float]]:
+        binary: bool = False,
+    ) -> dict[str, np.ndarray]:
         """Logarithmic voltage sweep, measuring current at each point."""
-        self._conn.reset()
-        self._measure.set_concurrent(False)
-        self._source.set_function("VOLT")
-        self._measure.set_function("CURR:DC")
-        self._measure.set_current_compliance(compliance)
-        self._measure.set_nplc("CURR", nplc)
-
-        self._conn.write(f":SOUR:VOLT:START {start:E}")
-        self._conn.write(f":SOUR:VOLT:STOP {stop:E}")
-        self._source.set_voltage_mode("SWE")
-        self._conn.write(":SOUR:SWE:RANG AUTO")
-        self._conn.write(":SOUR:SWE:SPAC LOG")
-        self._conn.write(f":SOUR:SWE:POIN {points}")
-        self._trigger.set_trigger_count(points)
-        self._source.set_delay(delay)
-
-        self._config.set_data_elements("VOLT", "CURR")
-
-        self._config.output_on()
-        raw = self._measure.read()
-        self._config.output_off()
-
-        return self._parse_two_element(raw, "voltage", "current")
+        key = ("vlog", start, stop, points, compliance, delay, nplc, binary)
+
+        def make_setup() -> list[str]:
+            return [
+                ":SENS:FUNC:CONC OFF",
+                ":SOUR:FUNC VOLT",
+                ':SENS:FUNC "CURR:DC"',
+                _FMT_CURR_PROT(compliance),
+                _FMT_CURR_NPLC(nplc),
+                _FMT_VSTART(start),
+                _FMT_VSTOP(stop),
+                ":SOUR:VOLT:MODE SWE",
+                ":SOUR:SWE:RANG AUTO",
+                ":SOUR:SWE:SPAC LOG",
+                _FMT_SWE_POIN(points),
+                _FMT_TRIG_COUN(points),
+                _FMT_SOUR_DEL(delay),
+                ":FORM:ELEM VOLT,CURR",
+            ]
+
+        raw = self._run_sweep(key, make_setup, binary, points, delay, nplc)
+        return self._parse_vi(raw)
 
     def current_sweep_log(
         self,
@@ -169,31 +318,31 @@ class Sweep:
         compliance: float,
         delay: float = 0.1,
         nplc: float = 1.0,
-    ) -> dict[str, list[float]]:
+        binary: bool = False,
+    ) -> dict[str, np.ndarray]:
         """Logarithmic current sweep, measuring voltage at each point."""
-        self._conn.reset()
-        self._measure.set_concurrent(False)
-        self._source.set_function("CURR")
-        self._measure.set_function("VOLT:DC")
-        self._measure.set_voltage_compliance(compliance)
-        self._measure.set_nplc("VOLT", nplc)
-
-        self._conn.write(f":SOUR:CURR:START {start:E}")
-        self._conn.write(f":SOUR:CURR:STOP {stop:E}")
-        self._source.set_current_mode("SWE")
-        self._conn.write(":SOUR:SWE:RANG AUTO")
-        self._conn.write(":SOUR:SWE:SPAC LOG")
-        self._conn.write(f":SOUR:SWE:POIN {points}")
-        self._trigger.set_trigger_count(points)
-        self._source.set_delay(delay)
-
-        self._config.set_data_elements("VOLT", "CURR")
-
-        self._config.output_on()
-        raw = self._measure.read()
-        self._config.output_off()
-
-        return self._parse_two_element(raw, "voltage", "current")
+        key = ("clog", start, stop, points, compliance, delay, nplc, binary)
+
+        def make_setup() -> list[str]:
+            return [
+                ":SENS:FUNC:CONC OFF",
+                ":SOUR:FUNC CURR",
+                ':SENS:FUNC "VOLT:DC"',
+                _FMT_VOLT_PROT(compliance),
+                _FMT_VOLT_NPLC(nplc),
+                _FMT_CSTART(start),
+                _FMT_CSTOP(stop),
+                ":SOUR:CURR:MODE SWE",
+                ":SOUR:SWE:RANG AUTO",
+                ":SOUR:SWE:SPAC LOG",
+                _FMT_SWE_POIN(points),
+                _FMT_TRIG_COUN(points),
+                _FMT_SOUR_DEL(delay),
+                ":FORM:ELEM VOLT,CURR",
+            ]
+
+        raw = self._run_sweep(key, make_setup, binary, points, delay, nplc)
+        return self._parse_vi(raw)
 
     # -- custom (list) sweeps --------------------------------------------
 
@@ -203,28 +352,28 @@ class Sweep:
         compliance: float,
         delay: float = 0.1,
         nplc: float = 1.0,
-    ) -> dict[str, list[float]]:
+        binary: bool = False,
+    ) -> dict[str, np.ndarray]:
         """Custom voltage sweep from a list of arbitrary voltage values."""
-        self._conn.reset()
-        self._measure.set_concurrent(False)
-        self._source.set_function("VOLT")
-        self._measure.set_function("CURR:DC")
-        self._measure.set_current_compliance(compliance)
-        self._measure.set_nplc("CURR", nplc)
-
-        self._source.set_voltage_mode("LIST")
-        volt_str = ",".join(f"{v:E}" for v in voltages)
-        self._conn.write(f":SOUR:LIST:VOLT {volt_str}")
-        self._trigger.set_trigger_count(len(voltages))
-        self._source.set_delay(delay)
-
-        self._config.set_data_elements("VOLT", "CURR")
-
-        self._config.output_on()
-        raw = self._measure.read()
-        self._config.output_off()
-
-        return self._parse_two_element(raw, "voltage", "current")
+        key = ("vlist", tuple(voltages), compliance, delay, nplc, binary)
+
+        def make_setup() -> list[str]:
+            volt_str = _format_setpoints(voltages)
+            return [
+                ":SENS:FUNC:CONC OFF",
+                ":SOUR:FUNC VOLT",
+                ':SENS:FUNC "CURR:DC"',
+                _FMT_CURR_PROT(compliance),
+                _FMT_CURR_NPLC(nplc),
+                ":SOUR:VOLT:MODE LIST",
+                _FMT_LIST_VOLT(volt_str),
+                _FMT_TRIG_COUN(len(voltages)),
+                _FMT_SOUR_DEL(delay),
+                ":FORM:ELEM VOLT,CURR",
+            ]
+
+        raw = self._run_sweep(key, make_setup, binary, len(voltages), delay, nplc)
+        return self._parse_vi(raw)
 
     def current_sweep_list(
         self,
@@ -232,36 +381,214 @@ class Sweep:
         compliance: float,
         delay: float = 0.1,
         nplc: float = 1.0,
-    ) -> dict[str, list[float]]:
+        binary: bool = False,
+    ) -> dict[str, np.ndarray]:
         """Custom current sweep from a list of arbitrary current values."""
-        self._conn.reset()
-        self._measure.set_concurrent(False)
-        self._source.set_function("CURR")
-        self._measure.set_function("VOLT:DC")
-        self._measure.set_voltage_compliance(compliance)
-        self._measure.set_nplc("VOLT", nplc)
+        key = ("clist", tuple(currents), compliance, delay, nplc, binary)
+
+        def make_setup() -> list[str]:
+            curr_str = _format_setpoints(currents)
+            return [
+                ":SENS:FUNC:CONC OFF",
+                ":SOUR:FUNC CURR",
+                ':SENS:FUNC "VOLT:DC"',
+                _FMT_VOLT_PROT(compliance),
+                _FMT_VOLT_NPLC(nplc),
+                ":SOUR:CURR:MODE LIST",
+                _FMT_LIST_CURR(curr_str),
+                _FMT_TRIG_COUN(len(currents)),
+                _FMT_SOUR_DEL(delay),
+                ":FORM:ELEM VOLT,CURR",
+            ]
+
+        raw = self._run_sweep(key, make_setup, binary, len(currents), delay, nplc)
+        return self._parse_vi(raw)
+
+    def voltage_sweep_list_buffered(
+        self,
+        voltages: list[float],
+        compliance: float,
+        delay: float = 0.1,
+        nplc: float = 1.0,
+        binary: bool = False,
+    ) -> dict[str, np.ndarray]:
+        """Custom voltage sweep executed entirely by the instrument.
 
-        self._source.set_current_mode("LIST")
-        curr_str = ",".join(f"{c:E}" for c in currents)
-        self._conn.write(f":SOUR:LIST:CURR {curr_str}")
-        self._trigger.set_trigger_count(len(currents))
-        self._source.set_delay(delay)
+        Unlike :meth:`voltage_sweep_list`, the readings are collected
+        in the trace buffer while the firmware paces the sweep: Python
+        sends one setup message, arms with ``:INIT``, blocks on
+        ``*OPC?`` and drains the buffer with a single bulk
+        ``:TRAC:DATA?`` at the end.  With ``binary=True`` the buffer
+        is transferred as a ``REAL,32`` block.
 
-        self._config.set_data_elements("VOLT", "CURR")
+        Returns
+        -------
+        dict
+            ``{"voltage": [...], "current": [...]}``.
+        """
+        num_points = len(voltages)
+        volt_str = _format_setpoints(voltages)
+
+        conn = self._conn
+        self.invalidate()  # buffered setup bypasses the memo/state
+        # The setup reprograms :SENS:FUNC and :TRIG:COUN behind the
+        # measure/trigger caches
+        self._measure.invalidate()
+        self._trigger.invalidate()
+        conn.reset()
+        cmds = [
+            ":SENS:FUNC:CONC OFF",
+            ":SOUR:FUNC VOLT",
+            ':SENS:FUNC "CURR:DC"',
+            _FMT_CURR_PROT(compliance),
+            _FMT_CURR_NPLC(nplc),
+            ":SOUR:VOLT:MODE LIST",
+            _FMT_LIST_VOLT(volt_str),
+            _FMT_SOUR_DEL(delay),
+            ":FORM:ELEM VOLT,CURR",
+            _FMT_TRIG_COUN(num_points),
+            f":TRAC:POIN {num_points}",
+            ":TRAC:FEED SENS",
+            ":TRAC:FEED:CONT NEXT",
+        ]
+        if binary:
+            # SWAP byte order -- *RST default is big-endian NORMal
+            cmds += [":FORM:DATA REAL,32", ":FORM:BORD SWAP"]
+        conn.write_many(*cmds)
+
+        conn.write_many(":OUTP ON", ":INIT")
+        conn.operation_complete()  # block until the buffer fills
+        if binary:
+            raw = conn.query_binary_values(":TRAC:DATA?", datatype="f")
+            # Restore ASCII so later non-sweep readers parse correctly
+            conn.write_many(":FORM:DATA ASC", ":OUTP OFF")
+        else:
+            raw = conn.query_ascii_values(":TRAC:DATA?")
+            self._config.output_off()
+
+        return self._parse_vi(raw)
 
-        self._config.output_on()
-        raw = self._measure.read()
-        self._config.output_off()
+    # -- helpers ---------------------------------------------------------
 
-        return self._parse_two_element(raw, "voltage", "current")
+    # Bit 10 of the operation condition register -- set while the
+    # trigger model is in the idle state
+    _OPER_IDLE = 1 << 10
 
-    # -- helpers ---------------------------------------------------------
+    def _run_sweep(
+        self,
+        key: tuple,
+        make_setup,
+        binary: bool,
+        num_points: int,
+        delay: float,
+        nplc: float,
+    ) -> list[float]:
+        """Configure (if needed), arm, and execute one sweep.
+
+        The setup batch, ``:OUTP ON`` and ``:INIT`` go out as a single
+        compound message; when ``key`` matches the memo only the arm
+        commands are sent.  Completion is detected by polling the
+        operation condition register every 10 ms -- unlike ``*OPC?``,
+        a ``:STAT:OPER:COND?`` query returns immediately, so the
+        controller is free between polls and a wedged instrument
+        raises ``TimeoutError`` instead of hanging the caller.  The
+        readings are then drained with a single ``:FETC?``.
+        """
+        # Hoisted locals -- this method accounts for nearly every
+        # attribute access left on the sweep hot path
+        conn = self._conn
+        query = conn.query
+        arm = [":INIT"] if self._output_is_on else [":OUTP ON", ":INIT"]
+        if key == self._last_sweep_key:
+            if binary:
+                # ASCII was restored after the previous run; re-arm the
+                # binary format (BORD SWAP survives, there is no *RST)
+                conn.write_many(":FORM:DATA REAL,64", *arm)
+            else:
+                conn.write_many(*arm)
+        else:
+            if self._last_sweep_key is None:
+                # Unknown instrument state -- start from GPIB defaults
+                # (*RST also clears conn.programmed)
+                conn.reset()
+                self._output_is_on = False
+                arm = [":OUTP ON", ":INIT"]
+            setup = self._dedupe(make_setup())
+            fmt = [":FORM:DATA REAL,64", ":FORM:BORD SWAP"] if binary else []
+            conn.write_many(*setup, *fmt, *arm)
+            self._last_sweep_key = key
+            # The setup reprograms :SENS:FUNC and :TRIG:COUN behind
+            # the measure/trigger caches
+            self._measure.invalidate()
+            self._trigger.invalidate()
+        # Worst-case sweep duration (50 Hz line frequency) plus margin
+        timeout_s = 2.0 * num_points * (delay + nplc / 50.0) + 10.0
+        deadline = time.monotonic() + timeout_s
+        while not int(query(":STAT:OPER:COND?")) & self._OPER_IDLE:
+            if time.monotonic() > deadline:
+                raise TimeoutError(
+                    f"sweep of {num_points} points did not finish "
+                    f"within {timeout_s:.1f} s"
+                )
+            time.sleep(0.01)
+        if binary:
+            raw = conn.query_binary_values(":FETC?", datatype="d")
+            # Leave the instrument in ASCII so readers that don't
+            # reset first (:READ?, :TRAC:DATA?) parse correctly
+            if self._keep_output_on:
+                conn.write(":FORM:DATA ASC")
+            else:
+                conn.write_many(":FORM:DATA ASC", ":OUTP OFF")
+        else:
+            if np is not None:
+                # Parse straight into a float64 array -- the C-level
+                # converter skips one Python float() call per sample
+                raw = conn.query_ascii_values(":FETC?", container=np.array)
+            else:
+                raw = self._measure.fetch()
+            if not self._keep_output_on:
+                self._config.output_off()
+        self._output_is_on = self._keep_output_on
+        return raw
+
+    def _dedupe(self, cmds: list[str]) -> list[str]:
+        """Drop setup commands the instrument already holds.
+
+        Keeps the last occurrence per SCPI header, then filters out
+        commands whose value matches what was last written (tracked
+        per header on the shared connection, cleared by *RST and
+        ``invalidate``), so a sweep following a different sweep only
+        re-sends the parameters that actually changed.  The kept
+        commands are recorded when they go out through ``write_many``.
+        """
+        latest: dict[str, str] = {}
+        order: list[str] = []
+        for cmd in cmds:
+            header, _, value = cmd.partition(" ")
+            if header not in latest:
+                order.append(header)
+            latest[header] = value
+        last = self._conn.programmed
+        out: list[str] = []
+        for header in order:
+            value = latest[header]
+            if last.get(header) == value:
+                continue
+            out.append(f"{header} {value}" if value else header)
+        return out
+
+    # Specialized voltage/current parser shared by every sweep method
+    _parse_vi = staticmethod(_make_parser("voltage", "current"))
 
     @staticmethod
     def _parse_two_element(
         raw: list[float], key_a: str, key_b: str
-    ) -> dict[str, list[float]]:
-        """Parse a flat list of [a0, b0, a1, b1, ...] into two lists."""
-        a_vals = raw[0::2]
-        b_vals = raw[1::2]
-        return {key_a: a_vals, key_b: b_vals}
+    ) -> dict[str, np.ndarray]:
+        """Split a flat [a0, b0, a1, b1, ...] buffer into two columns.
+
+        Returns float64 array views of one reshaped copy -- no Python
+        float boxing and no second pass over the data.  Without numpy
+        the columns fall back to plain lists.  Generic entry point for
+        arbitrary keys; the sweep methods call :attr:`_parse_vi`.
+        """
+        return _make_parser(key_a, key_b)(raw)
@@ -7,12 +7,30 @@ from typing import TYPE_CHECKING
 if TYPE_CHECKING:
     from .connection import Connection
 
+# Numeric command templates bound once at import (parsed format specs
+# are cached inside the bound .format callables)
+_FMT_TRIG_COUN = ":TRIG:COUN {:d}".format
+_FMT_TRIG_DEL = ":TRIG:DEL {}".format
+_FMT_ARM_COUN = ":ARM:COUN {:d}".format
+_FMT_ARM_TIM = ":ARM:TIM {}".format
+
 
 class Trigger:
     """Configure the trigger model (arm layer + trigger layer)."""
 
+    __slots__ = ("_conn", "_trig_count", "_arm_count")
+
     def __init__(self, conn: Connection) -> None:
         self._conn = conn
+        # Last programmed counts -- only set_* mutate them, so getters
+        # can skip the bus round-trip
+        self._trig_count: int | None = None
+        self._arm_count: int | None = None
+
+    def invalidate(self) -> None:
+        """Forget cached counts (call after *RST or external writes)."""
+        self._trig_count = None
+        self._arm_count = None
 
     # -- initiate / abort ------------------------------------------------
 
@@ -28,14 +46,23 @@ class Trigger:
 
     def set_trigger_count(self, count: int) -> None:
         """Set trigger count (1 to 2500)."""
-        self._conn.write(f":TRIG:COUN {count}")
+        self._conn.write(_FMT_TRIG_COUN(count))
+        self._trig_count = count
 
     def get_trigger_count(self) -> int:
-        return int(float(self._conn.query(":TRIG:COUN?")))
+        if self._trig_count is not None:
+            return self._trig_count
+        resp = self._conn.query(":TRIG:COUN?")
+        try:
+            count = int(resp)
+        except ValueError:  # defensive: "10.0"-style response
+            count = int(float(resp))
+        self._trig_count = count
+        return count
 
     def set_trigger_delay(self, seconds: float) -> None:
         """Set trigger delay (0 to 999.9999 s)."""
-        self._conn.write(f":TRIG:DEL {seconds}")
+        self._conn.write(_FMT_TRIG_DEL(seconds))
 
     def get_trigger_delay(self) -> float:
         return float(self._conn.query(":TRIG:DEL?"))
@@ -57,14 +84,24 @@ class Trigger:
 
     def set_arm_count(self, count: int) -> None:
         """Set arm count (1 to 2500, or use ``'INF'`` for infinite)."""
-        self._conn.write(f":ARM:COUN {count}")
+        self._conn.write(_FMT_ARM_COUN(count))
+        self._arm_count = count
 
     def get_arm_count(self) -> int:
+        if self._arm_count is not None:
+            return self._arm_count
         resp = self._conn.query(":ARM:COUN?")
-        val = float(resp)
-        if val > 2500:
-            return -1  # represents INFinite
-        return int(val)
+        if resp.startswith("9.9") and "E+37" in resp:
+            # INFinite sentinel (9.910000E+37) -- string check, no
+            # float parse needed
+            self._arm_count = -1
+            return -1
+        try:
+            count = int(resp)
+        except ValueError:  # defensive: "10.0"-style response
+            count = int(float(resp))
+        self._arm_count = count
+        return count
 
     def set_arm_source(self, source: str) -> None:
         """Set arm layer control source.
@@ -82,7 +119,7 @@ class Trigger:
 
     def set_arm_timer(self, seconds: float) -> None:
         """Set arm timer interval (0.001 to 99999.99 s)."""
-        self._conn.write(f":ARM:TIM {seconds}")
+        self._conn.write(_FMT_ARM_TIM(seconds))
 
     def get_arm_timer(self) -> float:
         return float(self._conn.query(":ARM:TIM?"))
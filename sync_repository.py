@@ -3,19 +3,20 @@ GitHub Repository Sync Script for Office PC
 Downloads updated files from pic-wlt GitHub repository
 """
 
-from selenium import webdriver
-from selenium.webdriver.chrome.service import Service
-from selenium.webdriver.chrome.options import Options
+import asyncio
+import json
 import os
-import time
 from datetime import datetime
 
+import httpx
+
 # ============ CONFIGURATION ============
 GITHUB_USERNAME = "your-username"  # Replace with your GitHub username
 REPO_NAME = "pic-wlt"
 BASE_URL = f"https://raw.githubusercontent.com/{GITHUB_USERNAME}/{REPO_NAME}/main/"
 LOCAL_BASE_PATH = "C:/work/pic-wlt"  # Change to your local project path
-CHROMEDRIVER_PATH = "C:/tools/chromedriver.exe"  # Change to your chromedriver location
+MAX_CONCURRENT_DOWNLOADS = 16
+SYNC_STATE_PATH = os.path.join(LOCAL_BASE_PATH, ".sync_state.json")
 
 # Files to sync (add more as needed)
 FILES_TO_SYNC = [
@@ -27,28 +28,28 @@ FILES_TO_SYNC = [
     "src/controllers/camera_vision.py",
     "src/controllers/lca.py",
     "src/controllers/smu.py",
-    
+
     # Core modules
     "src/core/__init__.py",
     "src/core/device_manager.py",
     "src/core/data_logger.py",
     "src/core/error_handler.py",
-    
+
     # Protocols
     "src/protocols/__init__.py",
     "src/protocols/alignment.py",
     "src/protocols/measurement.py",
     "src/protocols/calibration.py",
-    
+
     # Utils
     "src/utils/__init__.py",
     "src/utils/file_io.py",
     "src/utils/validators.py",
-    
+
     # Config files
     "config/equipment_config.yaml",
     "config/test_parameters.yaml",
-    
+
     # Documentation
     "README.md",
     "CLAUDE.md",
@@ -57,44 +58,75 @@ FILES_TO_SYNC = [
 
 # ============ FUNCTIONS ============
 
-def setup_driver():
-    """Initialize Chrome WebDriver with headless option"""
-    chrome_options = Options()
-    # Uncomment next line to run without opening browser window
-    # chrome_options.add_argument('--headless')
-    chrome_options.add_argument('--disable-gpu')
-    chrome_options.add_argument('--no-sandbox')
-    
-    service = Service(executable_path=CHROMEDRIVER_PATH)
-    driver = webdriver.Chrome(service=service, options=chrome_options)
-    return driver
-
-def download_file(driver, github_path, local_path):
-    """Download a single file from GitHub"""
-    url = BASE_URL + github_path
-    
+def load_sync_state():
+    """Load the path -> ETag map from the previous sync (if any)"""
     try:
-        driver.get(url)
-        time.sleep(1)  # Wait for page to load
-        
-        # Try to get content from <pre> tag (raw content)
+        with open(SYNC_STATE_PATH, encoding='utf-8') as f:
+            return json.load(f)
+    except (FileNotFoundError, json.JSONDecodeError):
+        return {}
+
+def save_sync_state(etags):
+    """Persist the path -> ETag map for the next run"""
+    os.makedirs(os.path.dirname(SYNC_STATE_PATH), exist_ok=True)
+    with open(SYNC_STATE_PATH, 'w', encoding='utf-8') as f:
+        json.dump(etags, f, indent=2)
+
+async def download_file(client, semaphore, etags, github_path, local_path):
+    """Download a single file from GitHub (raw content, no browser)
+
+    Sends If-None-Match with the stored ETag; a 304 means the file is
+    unchanged and no body is transferred at all.
+    """
+    url = BASE_URL + github_path
+
+    headers = {}
+    etag = etags.get(github_path)
+    if etag and os.path.exists(local_path):
+        headers['If-None-Match'] = etag
+
+    async with semaphore:
         try:
-            content = driver.find_element("tag name", "pre").text
-        except:
-            # Fallback to body if no <pre> tag
-            content = driver.find_element("tag name", "body").text
-        
-        # Create directory if it doesn't exist
-        os.makedirs(os.path.dirname(local_path), exist_ok=True)
-        
-        # Write content to file
-        with open(local_path, 'w', encoding='utf-8') as f:
-            f.write(content)
-        
-        return True, f"✓ {github_path}"
-    
-    except Exception as e:
-        return False, f"✗ {github_path} - Error: {str(e)}"
+            response = await client.get(url, headers=headers)
+
+            if response.status_code == 304:
+                return True, f"= {github_path} (unchanged)"
+
+            response.raise_for_status()
+
+            # Create directory if it doesn't exist
+            os.makedirs(os.path.dirname(local_path), exist_ok=True)
+
+            # Raw endpoint returns the file bytes directly
+            with open(local_path, 'wb') as f:
+                f.write(response.content)
+
+            new_etag = response.headers.get('ETag')
+            if new_etag:
+                etags[github_path] = new_etag
+
+            return True, f"✓ {github_path}"
+
+        except Exception as e:
+            return False, f"✗ {github_path} - Error: {str(e)}"
+
+async def download_all(file_list):
+    """Fetch every file concurrently, bounded by a semaphore"""
+    semaphore = asyncio.Semaphore(MAX_CONCURRENT_DOWNLOADS)
+    etags = load_sync_state()
+
+    async with httpx.AsyncClient(timeout=30.0, follow_redirects=True) as client:
+        tasks = [
+            download_file(
+                client, semaphore, etags,
+                github_path, os.path.join(LOCAL_BASE_PATH, github_path),
+            )
+            for github_path in file_list
+        ]
+        results = await asyncio.gather(*tasks)
+
+    save_sync_state(etags)
+    return results
 
 def sync_repository():
     """Main function to sync all files"""
@@ -103,29 +135,22 @@ def sync_repository():
     print(f"Started at: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}")
     print("=" * 60)
     print()
-    
-    driver = setup_driver()
-    
+
+    results = asyncio.run(download_all(FILES_TO_SYNC))
+
     success_count = 0
     fail_count = 0
-    results = []
-    
-    try:
-        for github_path in FILES_TO_SYNC:
-            local_path = os.path.join(LOCAL_BASE_PATH, github_path)
-            success, message = download_file(driver, github_path, local_path)
-            
-            results.append(message)
-            print(message)
-            
-            if success:
-                success_count += 1
-            else:
-                fail_count += 1
-    
-    finally:
-        driver.quit()
-    
+    messages = []
+
+    for success, message in results:
+        messages.append(message)
+        print(message)
+
+        if success:
+            success_count += 1
+        else:
+            fail_count += 1
+
     # Summary
     print()
     print("=" * 60)
@@ -136,40 +161,34 @@ def sync_repository():
     print(f"✗ Failed: {fail_count}")
     print(f"Completed at: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}")
     print("=" * 60)
-    
+
     # Save log
     log_path = os.path.join(LOCAL_BASE_PATH, "logs", "sync_log.txt")
     os.makedirs(os.path.dirname(log_path), exist_ok=True)
-    
+
     with open(log_path, 'a', encoding='utf-8') as f:
         f.write(f"\n{'='*60}\n")
         f.write(f"Sync at: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}\n")
         f.write(f"Success: {success_count}, Failed: {fail_count}\n")
-        f.write('\n'.join(results))
+        f.write('\n'.join(messages))
         f.write(f"\n{'='*60}\n")
 
 def sync_specific_files(file_list):
     """Sync only specific files (useful for quick updates)"""
     print(f"Syncing {len(file_list)} specific files...")
-    
-    driver = setup_driver()
-    
-    try:
-        for github_path in file_list:
-            local_path = os.path.join(LOCAL_BASE_PATH, github_path)
-            success, message = download_file(driver, github_path, local_path)
-            print(message)
-    finally:
-        driver.quit()
+
+    results = asyncio.run(download_all(file_list))
+    for _, message in results:
+        print(message)
 
 # ============ MAIN ============
 
 if __name__ == "__main__":
     # Option 1: Sync all files
     sync_repository()
-    
+
     # Option 2: Sync specific files only (uncomment to use)
     # sync_specific_files([
     #     "src/controllers/vna.py",
     #     "src/controllers/motion_controller.py",
-    # ])
\ No newline at end of file
+    # ])
@@ -1,10 +1,85 @@
 """Shared fixtures -- MockConnection that records writes and returns
-configurable query responses, so tests run without a real instrument."""
+configurable query responses, so tests run without a real instrument.
+
+The mock-based modules are independent and safe under ``pytest -n auto``
+(pytest-xdist): each worker is a separate process, so the shared
+module-scoped MockConnection is never visible across workers.  Tests
+that talk to real hardware should carry ``@pytest.mark.serial`` and be
+run with ``--dist loadgroup`` so one worker owns the bus."""
 
 from __future__ import annotations
 
+import io
+from contextlib import contextmanager
+
 import pytest
 
+try:
+    import numpy as np
+except ImportError:  # numpy is optional, like in the package itself
+    np = None
+
+
+def make_two_element_payload(a, b) -> str:
+    """Build an ``a0,b0,a1,b1,...`` response string from two columns.
+
+    Goes through ``np.savetxt`` so large parametrized fixtures format
+    in one vectorized pass instead of a Python f-string per sample;
+    without numpy it falls back to a plain comprehension.
+    """
+    if np is None:
+        return ",".join(f"{x:.9g},{y:.9g}" for x, y in zip(a, b))
+    buf = io.StringIO()
+    cols = np.column_stack([np.asarray(a, float), np.asarray(b, float)])
+    np.savetxt(buf, cols, fmt="%.9g", delimiter=",")
+    return buf.getvalue().replace("\n", ",").rstrip(",")
+
+
+class CommandsView(list):
+    """Recorded-command list with O(1) ``in`` checks.
+
+    The suite asserts ``cmd in mock_conn.commands`` hundreds of times;
+    a parallel set turns those scans into hash lookups while keeping
+    full list semantics (ordering, ``index``, equality) intact.
+    """
+
+    def __init__(self, items=()) -> None:
+        super().__init__()
+        self._seen: set[str] = set()
+        # First/last occurrence index per command, maintained on append
+        # so ordering assertions skip the O(n) list.index scan
+        self._first_idx: dict[str, int] = {}
+        self._last_idx: dict[str, int] = {}
+        self.extend(items)
+
+    def append(self, cmd: str) -> None:
+        idx = len(self)
+        super().append(cmd)
+        self._seen.add(cmd)
+        self._first_idx.setdefault(cmd, idx)
+        self._last_idx[cmd] = idx
+
+    def extend(self, cmds) -> None:
+        for cmd in cmds:
+            self.append(cmd)
+
+    def clear(self) -> None:
+        super().clear()
+        self._seen.clear()
+        self._first_idx.clear()
+        self._last_idx.clear()
+
+    def __contains__(self, cmd: object) -> bool:
+        return cmd in self._seen
+
+    def first_index(self, cmd: str) -> int:
+        """Index of the first occurrence of ``cmd`` (O(1))."""
+        return self._first_idx[cmd]
+
+    def last_index(self, cmd: str) -> int:
+        """Index of the most recent occurrence of ``cmd`` (O(1))."""
+        return self._last_idx[cmd]
+
 
 class MockConnection:
     """Drop-in replacement for ``keithley2400.connection.Connection``.
@@ -18,32 +93,146 @@ class MockConnection:
         this dict before calling the code under test.
     """
 
+    __slots__ = ("commands", "responses", "_pipeline_buf", "dirty", "programmed")
+
     def __init__(self) -> None:
-        self.commands: list[str] = []
+        self.commands = CommandsView()
         self.responses: dict[str, str] = {}
+        self._pipeline_buf: list[str] | None = None
+        self.dirty = True
+        self.programmed: dict[str, str] = {}
+
+    def clear(self) -> None:
+        """Wipe recorded traffic and staged responses between tests."""
+        self.commands.clear()
+        self.responses.clear()
+        self._pipeline_buf = None
+        self.dirty = True
+        self.programmed.clear()
 
     # -- core I/O --------------------------------------------------------
 
+    def _record(self, cmd: str) -> None:
+        # Mirror of Connection._record -- per-header write tracking
+        header, _, value = cmd.partition(" ")
+        if not header.endswith("?"):
+            self.programmed[header] = value
+
     def write(self, cmd: str) -> None:
+        if self._pipeline_buf is not None:
+            self._pipeline_buf.append(cmd)
+            return
+        self._record(cmd)
+        self.dirty = True
         self.commands.append(cmd)
 
+    def write_raw(self, raw: bytes) -> None:
+        # Record the decoded command so assertions match write().  The
+        # real Connection only forgets the header here (it avoids the
+        # decode); recording the value is strictly more informed, and
+        # both keep the dedup helpers consistent with the instrument.
+        self.write(raw.decode("ascii").rstrip("\n"))
+
+    def write_bytes(self, buf: bytes) -> None:
+        self.write_raw(buf + b"\n")
+
+    def write_many(self, *cmds: str) -> None:
+        if self._pipeline_buf is not None:
+            self._pipeline_buf.extend(cmds)
+            return
+        for cmd in cmds:
+            self._record(cmd)
+        self.dirty = True
+        # Record the joined string -- exactly what goes on the wire.
+        self.commands.append(";".join(cmds))
+
+    @contextmanager
+    def pipeline(self):
+        # Mirror of Connection.pipeline for the deferred-write tests
+        self._pipeline_buf = []
+        try:
+            yield
+        finally:
+            buf, self._pipeline_buf = self._pipeline_buf, None
+            if buf:
+                self.write_many(*buf)
+
+    def _flush_pipeline(self) -> None:
+        buf = self._pipeline_buf
+        if buf:
+            self._pipeline_buf = None
+            self.write_many(*buf)
+            self._pipeline_buf = []
+
+    @property
+    def commands_set(self) -> frozenset[str]:
+        """Recorded commands as a set, for subset assertions.
+
+        Plain membership (``cmd in mock_conn.commands``) is already O(1)
+        through :class:`CommandsView`; this exposes the underlying set
+        for ``expected <= mock_conn.commands_set`` style checks.
+        """
+        return frozenset(self.commands._seen)
+
+    @property
+    def scpi_commands(self) -> CommandsView:
+        """Individual SCPI commands, with compound messages split on ``;``."""
+        out = CommandsView()
+        for entry in self.commands:
+            out.extend(entry.split(";"))
+        return out
+
     def query(self, cmd: str) -> str:
+        self._flush_pipeline()
         self.commands.append(cmd)
         return self.responses.get(cmd, "0")
 
+    def query_bool(self, cmd: str) -> bool:
+        return self.query(cmd).startswith("1")
+
     def query_ascii_values(
-        self, cmd: str, separator: str = ","
+        self, cmd: str, separator: str = ",", container: type = list
     ) -> list[float]:
+        self._flush_pipeline()
+        if ";" in cmd:
+            # Compound message: embedded setters program the instrument
+            for part in cmd.split(";"):
+                self._record(part)
+            self.dirty = True
         self.commands.append(cmd)
         raw = self.responses.get(cmd, "")
+        if not raw and ";" in cmd:
+            # Compound message: respond based on the embedded query
+            # (e.g. ":READ?") so tests keyed on the bare query work.
+            for key, value in self.responses.items():
+                if key in cmd:
+                    raw = value
+                    break
         if not raw:
-            return []
-        return [float(v) for v in raw.split(separator)]
+            return container([])
+        if np is not None:
+            # Parse the whole response in one C loop, mirroring what
+            # pyvisa does for the real Connection
+            values = np.fromstring(raw, dtype=np.float64, sep=separator)
+            return values.tolist() if container is list else container(values)
+        return container([float(v) for v in raw.split(separator)])
+
+    def query_binary_values(
+        self,
+        cmd: str,
+        datatype: str = "f",
+        container: type = list,
+        is_big_endian: bool = False,
+    ) -> list[float]:
+        # Tests stage responses as ASCII CSV regardless of wire format.
+        return self.query_ascii_values(cmd, container=container)
 
     # -- IEEE-488 helpers ------------------------------------------------
 
     def reset(self) -> None:
         self.write("*RST")
+        self.programmed.clear()
+        self.dirty = False
 
     def clear_status(self) -> None:
         self.write("*CLS")
@@ -57,6 +246,11 @@ class MockConnection:
     def wait(self) -> None:
         self.write("*WAI")
 
+    def wait_for_opc_event(self, timeout_ms: int | None = None) -> None:
+        # No VISA event plumbing on a mock -- record the arming
+        # commands so wait_complete() flows are assertable
+        self.write_many("*ESE 1", "*SRE 32", "*OPC")
+
     def self_test(self) -> int:
         return int(self.query("*TST?"))
 
@@ -70,7 +264,67 @@ class MockConnection:
         self.close()
 
 
-@pytest.fixture
+@pytest.fixture(scope="module")
 def mock_conn() -> MockConnection:
-    """Provide a fresh ``MockConnection`` for each test."""
+    """Provide one ``MockConnection`` per test module.
+
+    The instance is shared to skip per-test construction; the autouse
+    fixture below clears it before every test, which preserves the
+    isolation a fresh instance gave.
+    """
     return MockConnection()
+
+
+@pytest.fixture(autouse=True)
+def _reset_mock_conn(mock_conn: MockConnection) -> None:
+    """Clear the shared connection before each test."""
+    mock_conn.clear()
+
+
+@pytest.fixture(scope="module")
+def meas(mock_conn: MockConnection):
+    """One ``Measure`` per module -- it holds no state beyond the
+    connection, so sharing is safe and skips ~40 constructions."""
+    from keithley2400.measure import Measure
+
+    return Measure(mock_conn)
+
+
+@pytest.fixture(scope="module")
+def src(mock_conn: MockConnection):
+    """One ``Source`` per module (see ``meas``)."""
+    from keithley2400.source import Source
+
+    return Source(mock_conn)
+
+
+@pytest.fixture
+def smu(mock_conn: MockConnection):
+    """A Keithley2400 facade wired to the shared MockConnection.
+
+    Function-scoped (unlike ``meas``/``src``) because the facade and
+    its sweep sub-module carry driver-side caches that must not leak
+    between tests; the sub-module graph is still built once here
+    instead of in every test body.
+    """
+    from keithley2400.config import Config
+    from keithley2400.data import DataBuffer
+    from keithley2400.measure import Measure
+    from keithley2400.smu import Keithley2400
+    from keithley2400.source import Source
+    from keithley2400.status import Status
+    from keithley2400.sweep import Sweep
+    from keithley2400.trigger import Trigger
+
+    smu = object.__new__(Keithley2400)
+    smu.conn = mock_conn
+    smu.config = Config(mock_conn)
+    smu.source = Source(mock_conn)
+    smu.measure = Measure(mock_conn)
+    smu.trigger = Trigger(mock_conn)
+    smu.buffer = DataBuffer(mock_conn)
+    smu.status = Status(mock_conn)
+    smu.sweep = Sweep(
+        mock_conn, smu.source, smu.measure, smu.trigger, smu.config,
+    )
+    return smu
@@ -0,0 +1,86 @@
+"""Tests for AsyncConnection -- delegation to the synchronous Connection.
+
+The async layer only off-loads blocking calls to worker threads, so
+the tests drive short coroutines with ``asyncio.run`` against the same
+FakeInstrument the Connection tests use and assert the traffic landed
+on the wrapped instance.
+"""
+
+import asyncio
+
+from keithley2400.async_connection import AsyncConnection
+from keithley2400.connection import Connection
+from tests.test_connection import FakeInstrument, FakeResourceManager
+
+
+def _make_conn() -> tuple[FakeInstrument, Connection]:
+    inst = FakeInstrument()
+    conn = Connection(
+        "GPIB0::24::INSTR", resource_manager=FakeResourceManager(inst)
+    )
+    return inst, conn
+
+
+class TestAsyncDelegation:
+    def test_write_and_query(self):
+        inst, conn = _make_conn()
+        inst.responses["*IDN?"] = "KEITHLEY,2400,SN001,C30"
+
+        async def scenario() -> str:
+            aconn = AsyncConnection(connection=conn)
+            await aconn.write(":OUTP ON")
+            await aconn.write_many(":SOUR:FUNC VOLT", ":SOUR:VOLT:LEV 1")
+            return await aconn.identify()
+
+        idn = asyncio.run(scenario())
+        assert idn == "KEITHLEY,2400,SN001,C30"
+        assert ":OUTP ON" in inst.written
+        assert ":SOUR:FUNC VOLT;:SOUR:VOLT:LEV 1" in inst.written
+
+    def test_query_ascii_values(self):
+        inst, conn = _make_conn()
+        inst.responses[":READ?"] = "1.0,2.0"
+
+        async def scenario() -> list[float]:
+            aconn = AsyncConnection(connection=conn)
+            return await aconn.query_ascii_values(":READ?")
+
+        assert asyncio.run(scenario()) == [1.0, 2.0]
+
+    def test_reset_delegates(self):
+        inst, conn = _make_conn()
+
+        async def scenario() -> None:
+            aconn = AsyncConnection(connection=conn)
+            await aconn.reset()
+
+        asyncio.run(scenario())
+        assert "*RST" in inst.written
+        assert not conn.dirty
+
+    def test_context_manager_closes_session(self):
+        inst, conn = _make_conn()
+
+        async def scenario() -> None:
+            async with AsyncConnection(connection=conn):
+                pass
+
+        asyncio.run(scenario())
+        assert inst.closed
+
+    def test_concurrent_queries_overlap(self):
+        # Two wrapped instruments queried under one gather -- the
+        # point of the async layer is that neither blocks the other
+        inst_a, conn_a = _make_conn()
+        inst_b, conn_b = _make_conn()
+        inst_a.responses["*IDN?"] = "KEITHLEY,2400,A,C30"
+        inst_b.responses["*IDN?"] = "KEITHLEY,2400,B,C30"
+
+        async def scenario() -> tuple[str, str]:
+            a = AsyncConnection(connection=conn_a)
+            b = AsyncConnection(connection=conn_b)
+            return await asyncio.gather(a.identify(), b.identify())
+
+        idn_a, idn_b = asyncio.run(scenario())
+        assert idn_a.endswith("A,C30")
+        assert idn_b.endswith("B,C30")
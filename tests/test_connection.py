@@ -1,8 +1,92 @@
-"""Tests for the Connection class (via MockConnection stand-in)."""
+"""Tests for the Connection class.
 
+Covers MockConnection (the stand-in the rest of the suite relies on)
+and the real Connection wired to a fake pyvisa resource, so the cache
+and pipeline logic in connection.py is exercised directly.
+"""
+
+import pytest
+from pyvisa import constants
+
+from keithley2400.connection import Connection
 from tests.conftest import MockConnection
 
 
+class FakeInstrument:
+    """Minimal stand-in for a pyvisa messagebased resource."""
+
+    def __init__(self) -> None:
+        self.written: list[str] = []
+        self.query_log: list[str] = []
+        self.responses: dict[str, str] = {}
+        self.timeout = 0
+        self.chunk_size = 0
+        self.read_termination = ""
+        self.write_termination = ""
+        self.closed = False
+        # VISA event plumbing (wait_for_opc_event)
+        self.events_enabled: list = []
+        self.events_disabled: list = []
+        self.events_waited: list[tuple] = []
+        self.stb_reads = 0
+        self.wait_event_error: Exception | None = None
+
+    def write(self, cmd: str) -> None:
+        self.written.append(cmd)
+
+    def write_raw(self, raw: bytes) -> None:
+        self.written.append(raw.decode("ascii").rstrip("\n"))
+
+    def query(self, cmd: str) -> str:
+        self.query_log.append(cmd)
+        return self.responses.get(cmd, "0") + "\n"
+
+    def query_ascii_values(
+        self, cmd: str, separator: str = ",", container: type = list
+    ) -> list[float]:
+        self.query_log.append(cmd)
+        raw = self.responses.get(cmd, "")
+        if not raw:
+            return container([])
+        return container([float(v) for v in raw.split(separator)])
+
+    def enable_event(self, event_type, mechanism) -> None:
+        self.events_enabled.append(event_type)
+
+    def disable_event(self, event_type, mechanism) -> None:
+        self.events_disabled.append(event_type)
+
+    def wait_on_event(self, event_type, timeout_ms) -> None:
+        if self.wait_event_error is not None:
+            raise self.wait_event_error
+        self.events_waited.append((event_type, timeout_ms))
+
+    def read_stb(self) -> int:
+        self.stb_reads += 1
+        return 64  # ESB summary via SRQ
+
+    def close(self) -> None:
+        self.closed = True
+
+
+class FakeResourceManager:
+    def __init__(self, inst: FakeInstrument) -> None:
+        self._inst = inst
+
+    def open_resource(self, resource_string: str) -> FakeInstrument:
+        return self._inst
+
+
+@pytest.fixture
+def visa_conn():
+    """Real Connection bound to a FakeInstrument."""
+    inst = FakeInstrument()
+    conn = Connection(
+        "GPIB0::24::INSTR", resource_manager=FakeResourceManager(inst)
+    )
+    return inst, conn
+
+
 class TestMockConnectionBasics:
     """Verify that MockConnection itself behaves correctly -- these same
     assertions would apply to a real Connection talking to hardware."""
@@ -38,3 +122,164 @@ class TestMockConnectionBasics:
         with MockConnection() as conn:
             conn.write(":OUTP OFF")
         # no exception means __exit__ succeeded
+
+
+class TestPipeline:
+    def test_writes_deferred_until_exit(self, mock_conn: MockConnection):
+        with mock_conn.pipeline():
+            mock_conn.write(":SOUR:VOLT:LEV 1")
+            mock_conn.write(":OUTP ON")
+            assert mock_conn.commands == []
+        assert mock_conn.commands == [":SOUR:VOLT:LEV 1;:OUTP ON"]
+
+    def test_query_flushes_pending_writes(self, mock_conn: MockConnection):
+        with mock_conn.pipeline():
+            mock_conn.write(":OUTP ON")
+            mock_conn.query(":OUTP?")
+        assert mock_conn.commands == [":OUTP ON", ":OUTP?"]
+
+
+class TestConnectionPipeline:
+    """Pipeline behaviour of the real Connection class."""
+
+    def test_writes_deferred_and_joined(self, visa_conn):
+        inst, conn = visa_conn
+        with conn.pipeline():
+            conn.write(":SOUR:VOLT:LEV 1")
+            conn.write(":OUTP ON")
+            assert inst.written == []
+        assert inst.written == [":SOUR:VOLT:LEV 1;:OUTP ON"]
+
+    def test_query_flushes_pending_writes_first(self, visa_conn):
+        inst, conn = visa_conn
+        with conn.pipeline():
+            conn.write(":OUTP ON")
+            conn.query(":OUTP?")
+        assert inst.written == [":OUTP ON"]
+        assert inst.query_log == [":OUTP?"]
+
+    def test_nested_pipeline_rejected(self, visa_conn):
+        _, conn = visa_conn
+        with conn.pipeline():
+            with pytest.raises(RuntimeError):
+                with conn.pipeline():
+                    pass
+
+
+class TestConnectionCache:
+    """TTL query cache behaviour of the real Connection class."""
+
+    def test_repeat_query_served_from_cache(self, visa_conn):
+        inst, conn = visa_conn
+        conn.enable_cache(ttl_s=60.0)
+        inst.responses[":OUTP?"] = "1"
+        assert conn.query(":OUTP?") == "1"
+        assert conn.query(":OUTP?") == "1"
+        assert inst.query_log.count(":OUTP?") == 1
+
+    def test_volatile_query_never_cached(self, visa_conn):
+        inst, conn = visa_conn
+        conn.enable_cache(ttl_s=60.0)
+        inst.responses[":SYST:ERR?"] = '0,"No error"'
+        conn.query(":SYST:ERR?")
+        conn.query(":SYST:ERR?")
+        assert inst.query_log.count(":SYST:ERR?") == 2
+
+    def test_opc_query_never_cached(self, visa_conn):
+        inst, conn = visa_conn
+        conn.enable_cache(ttl_s=60.0)
+        inst.responses["*OPC?"] = "1"
+        conn.query("*OPC?")
+        conn.query("*OPC?")
+        assert inst.query_log.count("*OPC?") == 2
+
+    def test_write_invalidates_matching_subsystem(self, visa_conn):
+        inst, conn = visa_conn
+        conn.enable_cache(ttl_s=60.0)
+        inst.responses[":SOUR:VOLT:LEV?"] = "1.0"
+        conn.query(":SOUR:VOLT:LEV?")
+        conn.write(":SOUR:VOLT:LEV 5")
+        conn.query(":SOUR:VOLT:LEV?")
+        assert inst.query_log.count(":SOUR:VOLT:LEV?") == 2
+
+    def test_unrelated_write_keeps_cache(self, visa_conn):
+        inst, conn = visa_conn
+        conn.enable_cache(ttl_s=60.0)
+        inst.responses[":SOUR:VOLT:LEV?"] = "1.0"
+        conn.query(":SOUR:VOLT:LEV?")
+        conn.write(":SENS:CURR:PROT 0.1")
+        conn.query(":SOUR:VOLT:LEV?")
+        assert inst.query_log.count(":SOUR:VOLT:LEV?") == 1
+
+    def test_query_bool_uses_cache(self, visa_conn):
+        inst, conn = visa_conn
+        conn.enable_cache(ttl_s=60.0)
+        inst.responses[":OUTP?"] = "1"
+        assert conn.query_bool(":OUTP?") is True
+        assert conn.query_bool(":OUTP?") is True
+        assert inst.query_log.count(":OUTP?") == 1
+
+    def test_dirty_after_compound_query(self, visa_conn):
+        # source_voltage/source_current program the instrument through
+        # setters embedded in a compound query -- they must dirty the
+        # connection like a plain write would
+        inst, conn = visa_conn
+        conn.reset()
+        assert not conn.dirty
+        inst.responses[":SOUR:VOLT:LEV 5;:READ?"] = "5.0"
+        conn.query_ascii_values(":SOUR:VOLT:LEV 5;:READ?")
+        assert conn.dirty
+
+    def test_plain_query_keeps_clean(self, visa_conn):
+        inst, conn = visa_conn
+        conn.reset()
+        inst.responses[":READ?"] = "1.0"
+        conn.query_ascii_values(":READ?")
+        assert not conn.dirty
+
+    def test_write_raw_invalidates_decoded_command(self, visa_conn):
+        inst, conn = visa_conn
+        conn.enable_cache(ttl_s=60.0)
+        inst.responses[":OUTP?"] = "0"
+        conn.query(":OUTP?")
+        conn.write_raw(b":OUTP ON\n")
+        conn.query(":OUTP?")
+        assert inst.query_log.count(":OUTP?") == 2
+
+
+class TestOpcEventWait:
+    """SRQ-based completion wait of the real Connection class."""
+
+    _SRQ = constants.EventType.service_request
+
+    def test_arming_sequence(self, visa_conn):
+        inst, conn = visa_conn
+        conn.wait_for_opc_event()
+        # OPC bit -> event summary -> service request, then arm *OPC
+        assert inst.written == ["*ESE 1", "*SRE 32", "*OPC"]
+
+    def test_event_enabled_waited_and_cleared(self, visa_conn):
+        inst, conn = visa_conn
+        conn.wait_for_opc_event()
+        assert inst.events_enabled == [self._SRQ]
+        assert [event for event, _ in inst.events_waited] == [self._SRQ]
+        assert inst.stb_reads == 1  # SRQ cleared after the wait
+        assert inst.events_disabled == [self._SRQ]
+
+    def test_timeout_forwarded(self, visa_conn):
+        inst, conn = visa_conn
+        conn.wait_for_opc_event(timeout_ms=5_000)
+        assert inst.events_waited[0][1] == 5_000
+
+    def test_default_timeout_is_session_timeout(self, visa_conn):
+        inst, conn = visa_conn
+        conn.wait_for_opc_event()
+        assert inst.events_waited[0][1] == inst.timeout
+
+    def test_event_disabled_after_wait_failure(self, visa_conn):
+        inst, conn = visa_conn
+        inst.wait_event_error = TimeoutError("no SRQ")
+        with pytest.raises(TimeoutError):
+            conn.wait_for_opc_event()
+        # The queue must not stay armed behind later transactions
+        assert inst.events_disabled == [self._SRQ]
@@ -0,0 +1,49 @@
+"""Tests for data.py -- trace buffer and binary data format."""
+
+import pytest
+
+from keithley2400.data import DataBuffer
+from tests.conftest import MockConnection
+
+
+class TestBufferRead:
+    def test_read_is_one_transaction(self, mock_conn: MockConnection):
+        buf = DataBuffer(mock_conn)
+        mock_conn.responses[":TRAC:DATA?"] = "1.0,2.5e-3,1.0e4"
+        vals = buf.read()
+        # The whole trace comes back on one query -- no per-point reads
+        assert list(mock_conn.commands) == [":TRAC:DATA?"]
+        assert vals == pytest.approx([1.0, 2.5e-3, 1.0e4])
+
+    def test_read_as_numpy(self, mock_conn: MockConnection):
+        np = pytest.importorskip("numpy")
+        buf = DataBuffer(mock_conn)
+        mock_conn.responses[":TRAC:DATA?"] = "1.0,2.0"
+        vals = buf.read(as_numpy=True)
+        assert isinstance(vals, np.ndarray)
+        assert vals == pytest.approx([1.0, 2.0])
+
+
+class TestBinaryFormat:
+    def test_set_binary_format_pairs_byte_order(self, mock_conn: MockConnection):
+        buf = DataBuffer(mock_conn)
+        buf.set_binary_format(32)
+        cmds = mock_conn.scpi_commands
+        # REAL,32 without SWAP would decode big-endian garbage
+        assert ":FORM:DATA REAL,32" in cmds
+        assert ":FORM:BORD SWAP" in cmds
+
+    def test_set_binary_format_64(self, mock_conn: MockConnection):
+        buf = DataBuffer(mock_conn)
+        buf.set_binary_format(64)
+        assert ":FORM:DATA REAL,64" in mock_conn.scpi_commands
+
+    def test_invalid_precision_rejected(self, mock_conn: MockConnection):
+        buf = DataBuffer(mock_conn)
+        with pytest.raises(ValueError):
+            buf.set_binary_format(16)
+
+    def test_ascii_format_restored(self, mock_conn: MockConnection):
+        buf = DataBuffer(mock_conn)
+        buf.set_ascii_format()
+        assert ":FORM:DATA ASC" in mock_conn.commands
@@ -6,15 +6,29 @@ Run directly:
 
 Optionally pass a VISA resource string:
     python tests/test_instrument.py GPIB0::24::INSTR
+
+Under pytest the same routines are collected as ordinary tests.  The
+module-local ``smu`` fixture below shadows the mock-backed one from
+conftest.py and skips unless ``KEITHLEY2400_RESOURCE`` names a VISA
+resource, so a plain ``pytest`` run never pretends to talk to hardware:
+
+    KEITHLEY2400_RESOURCE=GPIB0::24::INSTR pytest tests/test_instrument.py
 """
 
 from __future__ import annotations
 
+import os
 import sys
-import time
+
+import pytest
 
 from keithley2400 import Keithley2400
 
+# Everything in this module drives one physical instrument over one
+# bus; under pytest-xdist run with --dist loadgroup so a single worker
+# owns it (see the serial marker registration in pyproject.toml)
+pytestmark = pytest.mark.serial
+
 
 # ── helpers ─────────────────────────────────────────────────────────
 
@@ -36,251 +50,261 @@ def _info(msg: str) -> None:
     print(f"  [INFO] {msg}")
 
 
+@pytest.fixture(scope="module")
+def smu():
+    """Real instrument session, shadowing the conftest mock fixture."""
+    resource = os.environ.get("KEITHLEY2400_RESOURCE")
+    if resource is None:
+        pytest.skip("set KEITHLEY2400_RESOURCE to run hardware tests")
+    with Keithley2400(resource) as smu:
+        yield smu
+        # Always leave the instrument in a safe state
+        smu.reset()
+
+
 # ── test routines ───────────────────────────────────────────────────
+# Each routine raises (usually AssertionError) on failure; the script
+# runner below counts exceptions, pytest reports them natively.
 
-def test_connection(smu: Keithley2400) -> bool:
+def test_connection(smu: Keithley2400) -> None:
     """Test 1: Identify the instrument and verify it responds."""
-    _header("Test 1: Connection & Identification")
-    try:
-        idn = smu.identify()
-        _info(f"*IDN? -> {idn}")
-        if "KEITHLEY" in idn.upper() or "2400" in idn:
-            _pass("Instrument identified as Keithley 2400 series.")
-            return True
-        else:
-            _fail(f"Unexpected IDN response: {idn}")
-            return False
-    except Exception as e:
-        _fail(f"Communication error: {e}")
-        return False
-
-
-def test_reset(smu: Keithley2400) -> bool:
+    idn = smu.identify()
+    _info(f"*IDN? -> {idn}")
+    assert "KEITHLEY" in idn.upper() or "2400" in idn, (
+        f"Unexpected IDN response: {idn}"
+    )
+    _pass("Instrument identified as Keithley 2400 series.")
+
+
+def test_reset(smu: Keithley2400) -> None:
     """Test 2: Reset and verify default state."""
-    _header("Test 2: Reset (*RST)")
-    try:
-        smu.reset()
-        # After *RST the output should be off
-        is_on = smu.config.is_output_on()
-        _info(f"Output state after *RST: {'ON' if is_on else 'OFF'}")
-        if not is_on:
-            _pass("Output is OFF after reset (expected).")
-            return True
-        else:
-            _fail("Output is ON after reset -- unexpected.")
-            return False
-    except Exception as e:
-        _fail(f"Error during reset test: {e}")
-        return False
-
-
-def test_error_queue(smu: Keithley2400) -> bool:
+    smu.reset()
+    # After *RST the output should be off
+    is_on = smu.config.is_output_on()
+    _info(f"Output state after *RST: {'ON' if is_on else 'OFF'}")
+    assert not is_on, "Output is ON after reset -- unexpected."
+    _pass("Output is OFF after reset (expected).")
+
+
+def test_error_queue(smu: Keithley2400) -> None:
     """Test 3: Read the error queue -- should be clean after reset."""
-    _header("Test 3: Error Queue")
-    try:
-        code, msg = smu.status.read_error()
-        _info(f"Error queue: ({code}, \"{msg}\")")
-        if code == 0:
-            _pass("Error queue is clean.")
-            return True
-        else:
-            _fail(f"Unexpected error in queue: {code}, {msg}")
-            return False
-    except Exception as e:
-        _fail(f"Error reading error queue: {e}")
-        return False
-
-
-def test_config_terminals(smu: Keithley2400) -> bool:
+    code, msg = smu.status.read_error()
+    _info(f"Error queue: ({code}, \"{msg}\")")
+    assert code == 0, f"Unexpected error in queue: {code}, {msg}"
+    _pass("Error queue is clean.")
+
+
+def test_config_terminals(smu: Keithley2400) -> None:
     """Test 4: Query terminal selection."""
-    _header("Test 4: Terminal Selection Query")
-    try:
-        terminals = smu.config.get_terminals()
-        _info(f"Active terminals: {terminals}")
-        _pass(f"Terminal query returned: {terminals}")
-        return True
-    except Exception as e:
-        _fail(f"Error querying terminals: {e}")
-        return False
-
-
-def test_source_voltage_readback(smu: Keithley2400) -> bool:
+    terminals = smu.config.get_terminals()
+    _info(f"Active terminals: {terminals}")
+    _pass(f"Terminal query returned: {terminals}")
+
+
+def test_source_voltage_readback(smu: Keithley2400) -> None:
     """Test 5: Configure a voltage source and read back the setting
     (output stays OFF -- no voltage is actually applied)."""
-    _header("Test 5: Voltage Source Configuration (output OFF)")
-    try:
-        smu.reset()
-        smu.source.set_function("VOLT")
-        smu.source.set_voltage_mode("FIX")
-        smu.source.set_voltage_range(20)
-        smu.source.set_voltage(1.0)
-
-        readback = smu.source.get_voltage()
-        _info(f"Programmed 1.0 V, readback: {readback} V")
-
-        if abs(readback - 1.0) < 1e-6:
-            _pass("Voltage source readback matches programmed value.")
-            return True
-        else:
-            _fail(f"Readback mismatch: expected 1.0, got {readback}")
-            return False
-    except Exception as e:
-        _fail(f"Error: {e}")
-        return False
-
-
-def test_current_compliance_readback(smu: Keithley2400) -> bool:
+    smu.ensure_clean()
+    # One compound message instead of four writes -- each separate
+    # write is a full GPIB transaction
+    smu.conn.write_many(
+        ":SOUR:FUNC VOLT",
+        ":SOUR:VOLT:MODE FIX",
+        ":SOUR:VOLT:RANG 20",
+        ":SOUR:VOLT:LEV 1.0",
+    )
+
+    readback = smu.source.get_voltage()
+    _info(f"Programmed 1.0 V, readback: {readback} V")
+    assert abs(readback - 1.0) < 1e-6, (
+        f"Readback mismatch: expected 1.0, got {readback}"
+    )
+    _pass("Voltage source readback matches programmed value.")
+
+
+def test_current_compliance_readback(smu: Keithley2400) -> None:
     """Test 6: Set current compliance and read it back."""
-    _header("Test 6: Current Compliance Readback")
-    try:
-        smu.measure.set_current_compliance(10e-3)
-        readback = smu.measure.get_current_compliance()
-        _info(f"Programmed 10 mA compliance, readback: {readback} A")
-
-        if abs(readback - 10e-3) < 1e-6:
-            _pass("Current compliance readback matches.")
-            return True
-        else:
-            _fail(f"Readback mismatch: expected 0.01, got {readback}")
-            return False
-    except Exception as e:
-        _fail(f"Error: {e}")
-        return False
-
-
-def test_source_voltage_measure_current(smu: Keithley2400) -> bool:
+    smu.measure.set_current_compliance(10e-3)
+    readback = smu.measure.get_current_compliance()
+    _info(f"Programmed 10 mA compliance, readback: {readback} A")
+    assert abs(readback - 10e-3) < 1e-6, (
+        f"Readback mismatch: expected 0.01, got {readback}"
+    )
+    _pass("Current compliance readback matches.")
+
+
+def test_source_voltage_measure_current(smu: Keithley2400) -> None:
     """Test 7: Source 0 V, measure current (should read ~0 A with
     nothing connected, or a small leakage current).
 
     WARNING: This test turns the output ON briefly.
     """
-    _header("Test 7: Source 0V / Measure Current (output ON)")
-    try:
-        smu.reset()
-        smu.config.set_data_elements("VOLT", "CURR")
-        data = smu.source_voltage(0.0, compliance=10e-3, measure="CURR")
-        _info(f"Raw :READ? response: {data}")
-
-        if len(data) >= 2:
-            voltage = data[0]
-            current = data[1]
-            _info(f"Voltage: {voltage} V, Current: {current} A")
-            _pass("Source-measure cycle completed successfully.")
-            return True
-        else:
-            _fail(f"Unexpected data length: {len(data)}")
-            return False
-    except Exception as e:
-        _fail(f"Error: {e}")
-        return False
-
-
-def test_source_current_measure_voltage(smu: Keithley2400) -> bool:
+    smu.ensure_clean()
+    smu.config.set_data_elements("VOLT", "CURR")
+    # Binary readback: 8 bytes per reading instead of ~15 ASCII
+    # chars, decoded in one vectorized pass instead of float()
+    # per token
+    smu.buffer.set_binary_format(64)
+    smu.conn.write_many(
+        ":SOUR:FUNC VOLT",
+        ":SOUR:VOLT:MODE FIX",
+        ":SOUR:VOLT:LEV 0.0",
+        ":SENS:CURR:PROT 0.01",
+        ':SENS:FUNC "CURR"',
+        ":OUTP ON",
+    )
+    data = smu.measure.read_binary()
+    smu.conn.write_many(":FORM:DATA ASC", ":OUTP OFF")
+    _info(f"Binary :READ? response: {data}")
+
+    assert len(data) >= 2, f"Unexpected data length: {len(data)}"
+    voltage = data[0]
+    current = data[1]
+    _info(f"Voltage: {voltage} V, Current: {current} A")
+    _pass("Source-measure cycle completed successfully.")
+
+
+def test_source_current_measure_voltage(smu: Keithley2400) -> None:
     """Test 8: Source 0 A, measure voltage.
 
     WARNING: This test turns the output ON briefly.
     """
-    _header("Test 8: Source 0A / Measure Voltage (output ON)")
-    try:
-        smu.reset()
-        smu.config.set_data_elements("VOLT", "CURR")
-        data = smu.source_current(0.0, compliance=1.0, measure="VOLT")
-        _info(f"Raw :READ? response: {data}")
-
-        if len(data) >= 2:
-            voltage = data[0]
-            current = data[1]
-            _info(f"Voltage: {voltage} V, Current: {current} A")
-            _pass("Source-measure cycle completed successfully.")
-            return True
-        else:
-            _fail(f"Unexpected data length: {len(data)}")
-            return False
-    except Exception as e:
-        _fail(f"Error: {e}")
-        return False
-
-
-def test_data_format_elements(smu: Keithley2400) -> bool:
+    smu.ensure_clean()
+    smu.config.set_data_elements("VOLT", "CURR")
+    smu.buffer.set_binary_format(64)
+    smu.conn.write_many(
+        ":SOUR:FUNC CURR",
+        ":SOUR:CURR:MODE FIX",
+        ":SOUR:CURR:LEV 0.0",
+        ":SENS:VOLT:PROT 1.0",
+        ':SENS:FUNC "VOLT"',
+        ":OUTP ON",
+    )
+    data = smu.measure.read_binary()
+    smu.conn.write_many(":FORM:DATA ASC", ":OUTP OFF")
+    _info(f"Binary :READ? response: {data}")
+
+    assert len(data) >= 2, f"Unexpected data length: {len(data)}"
+    voltage = data[0]
+    current = data[1]
+    _info(f"Voltage: {voltage} V, Current: {current} A")
+    _pass("Source-measure cycle completed successfully.")
+
+
+def test_data_format_elements(smu: Keithley2400) -> None:
     """Test 9: Set data elements and verify readback."""
-    _header("Test 9: Data Format Elements")
-    try:
-        smu.config.set_data_elements("VOLT", "CURR")
-        readback = smu.config.get_data_elements()
-        _info(f"Set VOLT,CURR -> readback: {readback}")
-
-        if "VOLT" in readback and "CURR" in readback:
-            _pass("Data elements configured correctly.")
-            return True
-        else:
-            _fail(f"Unexpected readback: {readback}")
-            return False
-    except Exception as e:
-        _fail(f"Error: {e}")
-        return False
-
-
-def test_nplc_readback(smu: Keithley2400) -> bool:
+    smu.config.set_data_elements("VOLT", "CURR")
+    readback = smu.config.get_data_elements()
+    _info(f"Set VOLT,CURR -> readback: {readback}")
+    assert "VOLT" in readback and "CURR" in readback, (
+        f"Unexpected readback: {readback}"
+    )
+    _pass("Data elements configured correctly.")
+
+
+def test_nplc_readback(smu: Keithley2400) -> None:
     """Test 10: Set NPLC and verify readback."""
-    _header("Test 10: NPLC Speed Setting")
-    try:
-        smu.reset()
-        smu.source.set_function("VOLT")
-        smu.measure.set_function("CURR")
-        smu.measure.set_nplc("CURR", 0.1)
-        readback = smu.measure.get_nplc("CURR")
-        _info(f"Set NPLC=0.1, readback: {readback}")
-
-        if abs(readback - 0.1) < 0.01:
-            _pass("NPLC readback matches.")
-            return True
-        else:
-            _fail(f"NPLC mismatch: expected 0.1, got {readback}")
-            return False
-    except Exception as e:
-        _fail(f"Error: {e}")
-        return False
+    smu.ensure_clean()
+    smu.conn.write_many(
+        ":SOUR:FUNC VOLT",
+        ':SENS:FUNC "CURR"',
+        ":SENS:CURR:NPLC 0.1",
+    )
+    readback = smu.measure.get_nplc("CURR")
+    _info(f"Set NPLC=0.1, readback: {readback}")
+    assert abs(readback - 0.1) < 0.01, (
+        f"NPLC mismatch: expected 0.1, got {readback}"
+    )
+    _pass("NPLC readback matches.")
 
 
 # ── main ────────────────────────────────────────────────────────────
 
-def main() -> None:
-    resource = sys.argv[1] if len(sys.argv) > 1 else "GPIB0::24::INSTR"
-    print(f"Keithley 2400 Package Test")
-    print(f"VISA resource: {resource}")
-
-    tests = [
-        test_connection,
-        test_reset,
-        test_error_queue,
-        test_config_terminals,
-        test_source_voltage_readback,
-        test_current_compliance_readback,
-        test_source_voltage_measure_current,
-        test_source_current_measure_voltage,
-        test_data_format_elements,
-        test_nplc_readback,
-    ]
-
+# Declarative test table: (title, function, turns_output_on).  The
+# runner owns headers and exception handling; the flag marks tests
+# that briefly drive the output relay.
+TESTS = [
+    ("Connection & Identification", test_connection, False),
+    ("Reset (*RST)", test_reset, False),
+    ("Error Queue", test_error_queue, False),
+    ("Terminal Selection Query", test_config_terminals, False),
+    ("Voltage Source Configuration (output OFF)",
+     test_source_voltage_readback, False),
+    ("Current Compliance Readback", test_current_compliance_readback, False),
+    ("Source 0V / Measure Current (output ON)",
+     test_source_voltage_measure_current, True),
+    ("Source 0A / Measure Voltage (output ON)",
+     test_source_current_measure_voltage, True),
+    ("Data Format Elements", test_data_format_elements, False),
+    ("NPLC Speed Setting", test_nplc_readback, False),
+]
+
+
+def run_suite(resource: str) -> tuple[int, int]:
+    """Run the full test list against one instrument.
+
+    Returns ``(passed, failed)``.
+    """
     with Keithley2400(resource) as smu:
         passed = 0
         failed = 0
 
-        for test_fn in tests:
+        for number, (title, test_fn, _) in enumerate(TESTS, start=1):
+            _header(f"Test {number}: {title}")
             try:
-                ok = test_fn(smu)
+                test_fn(smu)
             except Exception as e:
-                _fail(f"Unhandled exception in {test_fn.__name__}: {e}")
-                ok = False
-
-            if ok:
-                passed += 1
-            else:
+                _fail(f"{test_fn.__name__}: {e}")
                 failed += 1
+            else:
+                passed += 1
 
         # Always leave the instrument in a safe state
         smu.reset()
 
+    return passed, failed
+
+
+def _bus_of(resource: str) -> str:
+    """Interface portion of a VISA resource string (``GPIB0``, ...).
+
+    Instruments on one GPIB bus share the controller, so their suites
+    must run back-to-back; separate buses (or LAN/USB resources) can
+    run in parallel workers.
+    """
+    return resource.split("::", 1)[0]
+
+
+def main() -> None:
+    resources = sys.argv[1:] or ["GPIB0::24::INSTR"]
+    print("Keithley 2400 Package Test")
+    print(f"VISA resources: {', '.join(resources)}")
+
+    if len(resources) == 1:
+        passed, failed = run_suite(resources[0])
+    else:
+        # Fan out across instruments -- one worker per bus, serial
+        # within a bus.  pyvisa I/O is blocking, so threads (not
+        # asyncio) give the overlap; output may interleave.
+        from concurrent.futures import ThreadPoolExecutor
+
+        groups: dict[str, list[str]] = {}
+        for res in resources:
+            groups.setdefault(_bus_of(res), []).append(res)
+
+        def run_group(group: list[str]) -> tuple[int, int]:
+            p = f = 0
+            for res in group:
+                gp, gf = run_suite(res)
+                p += gp
+                f += gf
+            return p, f
+
+        with ThreadPoolExecutor(max_workers=len(groups)) as pool:
+            totals = list(pool.map(run_group, groups.values()))
+        passed = sum(p for p, _ in totals)
+        failed = sum(f for _, f in totals)
+
     _header("Summary")
     total = passed + failed
     print(f"  Passed: {passed}/{total}")
@@ -1,57 +1,56 @@
 """Tests for smu.py -- Keithley2400 facade integration tests."""
 
-from unittest.mock import patch, MagicMock
-
 import pytest
 
-from keithley2400.smu import Keithley2400
-from keithley2400.config import Config
-from keithley2400.source import Source
-from keithley2400.measure import Measure
 from keithley2400.sweep import Sweep
 from tests.conftest import MockConnection
 
 
-def _make_smu(mock_conn: MockConnection) -> Keithley2400:
-    """Build a Keithley2400 instance wired to a MockConnection,
-    bypassing the real PyVISA resource manager."""
-    smu = object.__new__(Keithley2400)
-    smu.conn = mock_conn
-    smu.config = Config(mock_conn)
-    smu.source = Source(mock_conn)
-    smu.measure = Measure(mock_conn)
-    from keithley2400.trigger import Trigger
-    from keithley2400.data import DataBuffer
-    from keithley2400.status import Status
-    smu.trigger = Trigger(mock_conn)
-    smu.buffer = DataBuffer(mock_conn)
-    smu.status = Status(mock_conn)
-    smu.sweep = Sweep(
-        mock_conn, smu.source, smu.measure, smu.trigger, smu.config,
-    )
-    return smu
+class TestFacadeReset:
+    def test_reset_sends_rst(self, smu, mock_conn: MockConnection):
+        smu.reset()
+        assert "*RST" in mock_conn.commands
 
+    def test_ensure_clean_skips_redundant_reset(self, smu, mock_conn: MockConnection):
+        smu.reset()
+        mock_conn.commands.clear()
+        smu.ensure_clean()
+        assert "*RST" not in mock_conn.commands
 
-class TestFacadeReset:
-    def test_reset_sends_rst(self, mock_conn: MockConnection):
-        smu = _make_smu(mock_conn)
+    def test_ensure_clean_resets_after_write(self, smu, mock_conn: MockConnection):
+        smu.reset()
+        smu.source.set_function("VOLT")
+        mock_conn.commands.clear()
+        smu.ensure_clean()
+        assert "*RST" in mock_conn.commands
+
+    def test_ensure_clean_resets_after_compound_setter(self, smu, mock_conn: MockConnection):
         smu.reset()
+        mock_conn.responses[":READ?"] = "5.0,0.001"
+        smu.source_voltage(5.0, compliance=0.1)
+
+        mock_conn.commands.clear()
+        smu.ensure_clean()
+        # The convenience helpers program the instrument through a
+        # compound query, which drifts state like any write
         assert "*RST" in mock_conn.commands
 
-    def test_identify(self, mock_conn: MockConnection):
+    def test_identify(self, smu, mock_conn: MockConnection):
         mock_conn.responses["*IDN?"] = "KEITHLEY,2400,SN001,C30"
-        smu = _make_smu(mock_conn)
         assert smu.identify() == "KEITHLEY,2400,SN001,C30"
 
+    def test_wait_complete_arms_opc(self, smu, mock_conn: MockConnection):
+        smu.wait_complete()
+        assert "*OPC" in mock_conn.scpi_commands
+
 
 class TestSourceVoltageConvenience:
-    def test_source_voltage_command_flow(self, mock_conn: MockConnection):
+    def test_source_voltage_command_flow(self, smu, mock_conn: MockConnection):
         mock_conn.responses[":READ?"] = "5.0,0.001"
-        smu = _make_smu(mock_conn)
 
         result = smu.source_voltage(5.0, compliance=0.1)
 
-        cmds = mock_conn.commands
+        cmds = mock_conn.scpi_commands
         assert ":SOUR:FUNC VOLT" in cmds
         assert ":SOUR:VOLT:MODE FIX" in cmds
         assert ":SOUR:VOLT:LEV 5.000000E+00" in cmds
@@ -61,30 +60,56 @@ class TestSourceVoltageConvenience:
         assert ":READ?" in cmds
         assert ":OUTP OFF" in cmds
 
-    def test_source_voltage_returns_data(self, mock_conn: MockConnection):
+    def test_source_voltage_returns_data(self, smu, mock_conn: MockConnection):
         mock_conn.responses[":READ?"] = "5.0,0.001"
-        smu = _make_smu(mock_conn)
         result = smu.source_voltage(5.0, compliance=0.1)
         assert result == pytest.approx([5.0, 0.001])
 
-    def test_output_off_after_measurement(self, mock_conn: MockConnection):
+    def test_repeat_call_skips_unchanged_config(self, smu, mock_conn: MockConnection):
+        mock_conn.responses[":READ?"] = "5.0,0.001"
+        smu.source_voltage(5.0, compliance=0.1)
+
+        mock_conn.commands.clear()
+        mock_conn.responses[":READ?"] = "5.0,0.001"
+        smu.source_voltage(5.0, compliance=0.1)
+
+        cmds = mock_conn.scpi_commands
+        assert ":SOUR:FUNC VOLT" not in cmds
+        assert ":SOUR:VOLT:LEV 5.000000E+00" not in cmds
+        assert ":OUTP ON" in cmds
+        assert ":READ?" in cmds
+
+    def test_reconfigures_after_sweep(self, smu, mock_conn: MockConnection):
+        mock_conn.responses[":READ?"] = "5.0,0.001"
+        mock_conn.responses[":STAT:OPER:COND?"] = "1024"
+        mock_conn.responses[":FETC?"] = "0.0,1e-6,1.0,2e-6"
+        smu.source_voltage(5.0, compliance=0.1)
+        smu.sweep.voltage_sweep_linear(0, 1.0, 1.0, compliance=0.1)
+
+        mock_conn.commands.clear()
+        smu.source_voltage(5.0, compliance=0.1)
+
+        # The sweep *RST and left :SOUR:VOLT:MODE SWE behind; a bare
+        # :OUTP ON;:READ? here would arm a sweep, not a 5 V reading
+        cmds = mock_conn.scpi_commands
+        assert ":SOUR:VOLT:MODE FIX" in cmds
+        assert ":SOUR:VOLT:LEV 5.000000E+00" in cmds
+
+    def test_output_off_after_measurement(self, smu, mock_conn: MockConnection):
         mock_conn.responses[":READ?"] = "1.0"
-        smu = _make_smu(mock_conn)
         smu.source_voltage(1.0, compliance=0.1)
 
-        read_idx = mock_conn.commands.index(":READ?")
-        off_idx = mock_conn.commands.index(":OUTP OFF")
-        assert off_idx > read_idx
+        cmds = mock_conn.scpi_commands
+        assert cmds.first_index(":OUTP OFF") > cmds.first_index(":READ?")
 
 
 class TestSourceCurrentConvenience:
-    def test_source_current_command_flow(self, mock_conn: MockConnection):
+    def test_source_current_command_flow(self, smu, mock_conn: MockConnection):
         mock_conn.responses[":READ?"] = "3.3,0.001"
-        smu = _make_smu(mock_conn)
 
         result = smu.source_current(1e-3, compliance=10.0)
 
-        cmds = mock_conn.commands
+        cmds = mock_conn.scpi_commands
         assert ":SOUR:FUNC CURR" in cmds
         assert ":SOUR:CURR:MODE FIX" in cmds
         assert ":SOUR:CURR:LEV 1.000000E-03" in cmds
@@ -94,21 +119,40 @@ class TestSourceCurrentConvenience:
         assert ":READ?" in cmds
         assert ":OUTP OFF" in cmds
 
-    def test_source_current_returns_data(self, mock_conn: MockConnection):
+    def test_source_current_returns_data(self, smu, mock_conn: MockConnection):
         mock_conn.responses[":READ?"] = "3.3,0.001"
-        smu = _make_smu(mock_conn)
         result = smu.source_current(1e-3, compliance=10.0)
         assert result == pytest.approx([3.3, 0.001])
 
 
+class TestSourceVoltageBatch:
+    def test_setup_sent_once(self, smu, mock_conn: MockConnection):
+        mock_conn.responses[":READ?"] = "1.0,0.001"
+
+        results = smu.source_voltage_batch([1.0, 2.0, 3.0], compliance=0.1)
+
+        cmds = mock_conn.scpi_commands
+        assert cmds.count(":SOUR:FUNC VOLT") == 1
+        assert cmds.count(":SENS:CURR:PROT 1.000000E-01") == 1
+        assert cmds.count(":READ?") == 3
+        assert len(results) == 3
+
+    def test_levels_are_programmed(self, smu, mock_conn: MockConnection):
+        mock_conn.responses[":READ?"] = "1.0,0.001"
+        smu.source_voltage_batch([0.5, 1.5], compliance=0.1)
+        cmds = mock_conn.scpi_commands
+        assert ":SOUR:VOLT:LEV 5.000000E-01" in cmds
+        assert ":SOUR:VOLT:LEV 1.500000E+00" in cmds
+        assert cmds[-1] == ":OUTP OFF"
+
+
 class TestFacadeSweepAccess:
-    def test_sweep_is_accessible(self, mock_conn: MockConnection):
-        smu = _make_smu(mock_conn)
+    def test_sweep_is_accessible(self, smu, mock_conn: MockConnection):
         assert isinstance(smu.sweep, Sweep)
 
-    def test_linear_sweep_via_facade(self, mock_conn: MockConnection):
-        mock_conn.responses[":READ?"] = "0.0,1e-6,1.0,2e-6"
-        smu = _make_smu(mock_conn)
+    def test_linear_sweep_via_facade(self, smu, mock_conn: MockConnection):
+        mock_conn.responses[":STAT:OPER:COND?"] = "1024"
+        mock_conn.responses[":FETC?"] = "0.0,1e-6,1.0,2e-6"
         result = smu.sweep.voltage_sweep_linear(
             start=0, stop=1.0, step=1.0,
             compliance=0.1,
@@ -116,15 +160,28 @@ class TestFacadeSweepAccess:
         assert "voltage" in result
         assert "current" in result
 
+    def test_reset_invalidates_sweep_memo(self, smu, mock_conn: MockConnection):
+        mock_conn.responses[":STAT:OPER:COND?"] = "1024"
+        mock_conn.responses[":FETC?"] = "0.0,1e-6,1.0,2e-6"
+        smu.sweep.voltage_sweep_linear(0, 1.0, 1.0, compliance=0.1)
+
+        smu.reset()
+        mock_conn.commands.clear()
+        smu.sweep.voltage_sweep_linear(0, 1.0, 1.0, compliance=0.1)
+
+        # *RST wiped the sweep setup, so a repeat of the same sweep
+        # must reconfigure instead of only re-arming :OUTP ON;:INIT
+        cmds = mock_conn.scpi_commands
+        assert ":SOUR:VOLT:MODE SWE" in cmds
+        assert ":TRIG:COUN 2" in cmds
+
 
 class TestFacadeClose:
-    def test_close_turns_off_output(self, mock_conn: MockConnection):
-        smu = _make_smu(mock_conn)
+    def test_close_turns_off_output(self, smu, mock_conn: MockConnection):
         smu.close()
         assert ":OUTP OFF" in mock_conn.commands
 
-    def test_context_manager(self, mock_conn: MockConnection):
-        smu = _make_smu(mock_conn)
+    def test_context_manager(self, smu, mock_conn: MockConnection):
         smu.__enter__()
         smu.__exit__(None, None, None)
         assert ":OUTP OFF" in mock_conn.commands
@@ -133,8 +190,7 @@ class TestFacadeClose:
 class TestSubmoduleComposition:
     """Verify the facade wires all subsystems to the same connection."""
 
-    def test_all_modules_share_connection(self, mock_conn: MockConnection):
-        smu = _make_smu(mock_conn)
+    def test_all_modules_share_connection(self, smu, mock_conn: MockConnection):
         # Access different subsystems -- all should route to the same conn
         smu.config.output_on()
         smu.source.set_function("VOLT")
@@ -142,8 +198,11 @@ class TestSubmoduleComposition:
         smu.trigger.set_trigger_count(10)
         smu.buffer.set_size(100)
 
-        assert ":OUTP ON" in mock_conn.commands
-        assert ":SOUR:FUNC VOLT" in mock_conn.commands
-        assert ":SENS:CURR:PROT 1.000000E-01" in mock_conn.commands
-        assert ":TRIG:COUN 10" in mock_conn.commands
-        assert ":TRAC:POIN 100" in mock_conn.commands
+        expected = {
+            ":OUTP ON",
+            ":SOUR:FUNC VOLT",
+            ":SENS:CURR:PROT 0.1",
+            ":TRIG:COUN 10",
+            ":TRAC:POIN 100",
+        }
+        assert expected <= mock_conn.commands_set
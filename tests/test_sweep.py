@@ -7,12 +7,16 @@ from keithley2400.measure import Measure
 from keithley2400.source import Source
 from keithley2400.sweep import Sweep
 from keithley2400.trigger import Trigger
-from tests.conftest import MockConnection
+from tests.conftest import MockConnection, make_two_element_payload
 
 
-@pytest.fixture
+@pytest.fixture(scope="module")
 def sweep_setup(mock_conn: MockConnection):
-    """Create a full Sweep instance wired to a MockConnection."""
+    """Create a full Sweep instance wired to a MockConnection.
+
+    Module-scoped so the five-object graph is built once; the autouse
+    hook below restores driver-side state between tests.
+    """
     source = Source(mock_conn)
     measure = Measure(mock_conn)
     trigger = Trigger(mock_conn)
@@ -21,11 +25,29 @@ def sweep_setup(mock_conn: MockConnection):
     return mock_conn, sweep
 
 
+@pytest.fixture(autouse=True)
+def _reset_sweep_state(_reset_mock_conn, sweep_setup):
+    """Drop memoized sweep/trigger state and re-seed poll responses.
+
+    Runs after the shared connection is cleared (hence the explicit
+    dependency on ``_reset_mock_conn``) so each test starts from the
+    same blank instrument.
+    """
+    conn, sweep = sweep_setup
+    sweep.invalidate()
+    sweep._keep_output_on = False
+    sweep._trigger.invalidate()
+    # Sweeps poll the operation condition register until the trigger
+    # model is idle (bit 10); buffered sweeps block on *OPC?
+    conn.responses[":STAT:OPER:COND?"] = "1024"
+    conn.responses["*OPC?"] = "1"
+
+
 class TestVoltageSweepLinear:
     def test_command_sequence(self, sweep_setup):
         conn, sweep = sweep_setup
         # 0V to 1V in 0.5V steps -> 3 points, 2 elements each -> 6 floats
-        conn.responses[":READ?"] = (
+        conn.responses[":FETC?"] = (
             "0.0,1e-6,0.5,2e-6,1.0,3e-6"
         )
 
@@ -34,13 +56,13 @@ class TestVoltageSweepLinear:
             compliance=0.1, delay=0.05, nplc=1.0,
         )
 
-        # Verify key commands were sent in order
-        cmds = conn.commands
+        # Verify key commands were sent (compound messages split)
+        cmds = conn.scpi_commands
         assert "*RST" in cmds
         assert ":SENS:FUNC:CONC OFF" in cmds
         assert ":SOUR:FUNC VOLT" in cmds
         assert ':SENS:FUNC "CURR:DC"' in cmds
-        assert ":SENS:CURR:PROT 1.000000E-01" in cmds
+        assert ":SENS:CURR:PROT 0.1" in cmds
         assert ":SOUR:VOLT:START 0.000000E+00" in cmds
         assert ":SOUR:VOLT:STOP 1.000000E+00" in cmds
         assert ":SOUR:VOLT:STEP 5.000000E-01" in cmds
@@ -51,12 +73,14 @@ class TestVoltageSweepLinear:
         assert ":SOUR:DEL 0.05" in cmds
         assert ":FORM:ELEM VOLT,CURR" in cmds
         assert ":OUTP ON" in cmds
-        assert ":READ?" in cmds
+        assert ":INIT" in cmds
+        assert ":STAT:OPER:COND?" in cmds
+        assert ":FETC?" in cmds
         assert ":OUTP OFF" in cmds
 
     def test_returns_parsed_data(self, sweep_setup):
         conn, sweep = sweep_setup
-        conn.responses[":READ?"] = "0.0,1e-6,0.5,2e-6,1.0,3e-6"
+        conn.responses[":FETC?"] = "0.0,1e-6,0.5,2e-6,1.0,3e-6"
 
         result = sweep.voltage_sweep_linear(
             start=0.0, stop=1.0, step=0.5,
@@ -67,24 +91,36 @@ class TestVoltageSweepLinear:
         assert result["voltage"] == pytest.approx([0.0, 0.5, 1.0])
         assert result["current"] == pytest.approx([1e-6, 2e-6, 3e-6])
 
+    def test_returns_numpy_columns(self, sweep_setup):
+        np = pytest.importorskip("numpy")
+        conn, sweep = sweep_setup
+        conn.responses[":FETC?"] = "0.0,1e-6,0.5,2e-6"
+
+        result = sweep.voltage_sweep_linear(0.0, 0.5, 0.5, compliance=0.1)
+
+        # Struct-of-arrays contract: float64 columns, not boxed lists
+        assert isinstance(result["voltage"], np.ndarray)
+        assert isinstance(result["current"], np.ndarray)
+        assert result["voltage"].dtype == np.float64
+
     def test_output_off_after_read(self, sweep_setup):
         """Output must be turned off even after READ?."""
         conn, sweep = sweep_setup
-        conn.responses[":READ?"] = "0.0,0.0"
+        conn.responses[":FETC?"] = "0.0,0.0"
 
         sweep.voltage_sweep_linear(0, 0, 0.1, compliance=0.1)
 
-        read_idx = conn.commands.index(":READ?")
-        off_idx = conn.commands.index(":OUTP OFF")
-        assert off_idx > read_idx
+        cmds = conn.commands
+        assert cmds.first_index(":OUTP OFF") > cmds.first_index(":FETC?")
 
 
 class TestCurrentSweepLinear:
     def test_command_sequence(self, sweep_setup):
         conn, sweep = sweep_setup
         # 1mA to 10mA in 1mA steps -> 10 points
-        conn.responses[":READ?"] = ",".join(
-            f"{0.6 + i * 0.01},{(1 + i) * 1e-3}" for i in range(10)
+        conn.responses[":FETC?"] = make_two_element_payload(
+            [0.6 + i * 0.01 for i in range(10)],
+            [(1 + i) * 1e-3 for i in range(10)],
         )
 
         result = sweep.current_sweep_linear(
@@ -92,10 +128,10 @@ class TestCurrentSweepLinear:
             compliance=1.0, delay=0.1,
         )
 
-        cmds = conn.commands
+        cmds = conn.scpi_commands
         assert ":SOUR:FUNC CURR" in cmds
         assert ':SENS:FUNC "VOLT:DC"' in cmds
-        assert ":SENS:VOLT:PROT 1.000000E+00" in cmds
+        assert ":SENS:VOLT:PROT 1" in cmds
         assert ":SOUR:CURR:START 1.000000E-03" in cmds
         assert ":SOUR:CURR:STOP 1.000000E-02" in cmds
         assert ":SOUR:CURR:STEP 1.000000E-03" in cmds
@@ -105,17 +141,38 @@ class TestCurrentSweepLinear:
         assert len(result["current"]) == 10
 
 
+class TestVoltageSweepLinearBatch:
+    def test_shared_setup_sent_once(self, sweep_setup):
+        conn, sweep = sweep_setup
+        conn.responses[":FETC?"] = "0.0,1e-6"
+
+        results = sweep.voltage_sweep_linear_batch(
+            windows=[(0, 0, 0.1), (0, 1, 1.0)], compliance=0.1,
+        )
+
+        cmds = conn.scpi_commands
+        assert len(results) == 2
+        # Shared configuration goes out exactly once...
+        assert cmds.count("*RST") == 1
+        assert cmds.count(":SOUR:FUNC VOLT") == 1
+        assert cmds.count(":SENS:CURR:PROT 0.1") == 1
+        # ...while the window-specific commands are re-sent
+        assert ":SOUR:VOLT:STOP 0.000000E+00" in cmds
+        assert ":SOUR:VOLT:STOP 1.000000E+00" in cmds
+        assert cmds.count(":INIT") == 2
+
+
 class TestVoltageSweepLog:
     def test_uses_log_spacing(self, sweep_setup):
         conn, sweep = sweep_setup
-        conn.responses[":READ?"] = "0.1,1e-6,1.0,2e-6,10.0,3e-6"
+        conn.responses[":FETC?"] = "0.1,1e-6,1.0,2e-6,10.0,3e-6"
 
         sweep.voltage_sweep_log(
             start=0.1, stop=10.0, points=3,
             compliance=0.1,
         )
 
-        cmds = conn.commands
+        cmds = conn.scpi_commands
         assert ":SOUR:SWE:SPAC LOG" in cmds
         assert ":SOUR:SWE:POIN 3" in cmds
         assert ":TRIG:COUN 3" in cmds
@@ -125,15 +182,15 @@ class TestVoltageSweepList:
     def test_custom_list(self, sweep_setup):
         conn, sweep = sweep_setup
         voltages = [7.0, 1.0, 3.0, 8.0, 2.0]
-        conn.responses[":READ?"] = ",".join(
-            f"{v},{i * 1e-3}" for i, v in enumerate(voltages)
+        conn.responses[":FETC?"] = make_two_element_payload(
+            voltages, [i * 1e-3 for i in range(len(voltages))],
         )
 
         result = sweep.voltage_sweep_list(
             voltages=voltages, compliance=0.1,
         )
 
-        cmds = conn.commands
+        cmds = conn.scpi_commands
         assert ":SOUR:VOLT:MODE LIST" in cmds
         # Verify list command contains all voltages
         list_cmd = [c for c in cmds if c.startswith(":SOUR:LIST:VOLT")]
@@ -147,13 +204,13 @@ class TestCurrentSweepList:
     def test_custom_list(self, sweep_setup):
         conn, sweep = sweep_setup
         currents = [1e-3, 5e-3, 10e-3]
-        conn.responses[":READ?"] = "0.5,1e-3,0.6,5e-3,0.7,10e-3"
+        conn.responses[":FETC?"] = "0.5,1e-3,0.6,5e-3,0.7,10e-3"
 
         result = sweep.current_sweep_list(
             currents=currents, compliance=10.0,
         )
 
-        cmds = conn.commands
+        cmds = conn.scpi_commands
         assert ":SOUR:FUNC CURR" in cmds
         assert ":SOUR:CURR:MODE LIST" in cmds
         list_cmd = [c for c in cmds if c.startswith(":SOUR:LIST:CURR")]
@@ -163,15 +220,139 @@ class TestCurrentSweepList:
         assert result["current"] == pytest.approx([1e-3, 5e-3, 10e-3])
 
 
+class TestVoltageSweepListBuffered:
+    def test_offloads_to_instrument(self, sweep_setup):
+        conn, sweep = sweep_setup
+        conn.responses[":TRAC:DATA?"] = "1.0,1e-3,2.0,2e-3"
+
+        result = sweep.voltage_sweep_list_buffered(
+            voltages=[1.0, 2.0], compliance=0.1,
+        )
+
+        cmds = conn.scpi_commands
+        assert ":SOUR:VOLT:MODE LIST" in cmds
+        assert ":TRAC:POIN 2" in cmds
+        assert ":TRAC:FEED SENS" in cmds
+        assert ":TRAC:FEED:CONT NEXT" in cmds
+        assert ":INIT" in cmds
+        assert "*OPC?" in cmds
+        assert ":TRAC:DATA?" in cmds
+        # The whole sweep runs on the instrument -- no per-point :READ?
+        assert ":READ?" not in cmds
+        assert result["voltage"] == pytest.approx([1.0, 2.0])
+        assert result["current"] == pytest.approx([1e-3, 2e-3])
+
+
+class TestSweepMemo:
+    def test_repeat_sweep_skips_setup(self, sweep_setup):
+        conn, sweep = sweep_setup
+        conn.responses[":FETC?"] = "0.0,1e-6"
+
+        sweep.voltage_sweep_linear(0, 0, 0.1, compliance=0.1)
+        conn.commands.clear()
+        sweep.voltage_sweep_linear(0, 0, 0.1, compliance=0.1)
+
+        cmds = conn.scpi_commands
+        assert "*RST" not in cmds
+        assert ":SOUR:VOLT:MODE SWE" not in cmds
+        assert ":OUTP ON" in cmds
+        assert ":FETC?" in cmds
+
+    def test_different_args_resend_changed_commands(self, sweep_setup):
+        conn, sweep = sweep_setup
+        conn.responses[":FETC?"] = "0.0,1e-6"
+
+        sweep.voltage_sweep_linear(0, 0, 0.1, compliance=0.1)
+        conn.commands.clear()
+        sweep.voltage_sweep_linear(0, 1, 0.5, compliance=0.1)
+
+        cmds = conn.scpi_commands
+        # Changed parameters are re-sent; the instrument state is
+        # known, so there is no *RST and unchanged commands are
+        # deduplicated away
+        assert ":SOUR:VOLT:STOP 1.000000E+00" in cmds
+        assert ":TRIG:COUN 3" in cmds
+        assert "*RST" not in cmds
+        assert ":SENS:FUNC:CONC OFF" not in cmds
+
+    def test_sweep_invalidates_trigger_count_cache(self, sweep_setup):
+        conn, sweep = sweep_setup
+        conn.responses[":FETC?"] = "0.0,1e-6,1.0,2e-6"
+        trigger = sweep._trigger
+
+        trigger.set_trigger_count(10)
+        sweep.voltage_sweep_linear(0, 1.0, 1.0, compliance=0.1)  # 2 points
+
+        # The sweep wrote :TRIG:COUN 2 behind the cache -- the getter
+        # must go back to the bus instead of returning 10
+        conn.responses[":TRIG:COUN?"] = "2"
+        assert trigger.get_trigger_count() == 2
+
+    def test_sweep_invalidates_measure_cache(self, sweep_setup):
+        conn, sweep = sweep_setup
+        conn.responses[":READ?"] = "1.0"
+        conn.responses[":FETC?"] = "0.0,1e-6"
+        measure = sweep._measure
+
+        measure.measure("VOLT")
+        sweep.voltage_sweep_linear(0, 0, 0.1, compliance=0.1)
+        conn.commands.clear()
+        measure.measure("VOLT")
+
+        # The sweep reprogrammed :SENS:FUNC "CURR:DC", so a bare
+        # :READ? here would return current readings labeled as voltage
+        assert ':SENS:FUNC "VOLT"' in conn.commands
+
+    def test_invalidate_forces_reconfigure(self, sweep_setup):
+        conn, sweep = sweep_setup
+        conn.responses[":FETC?"] = "0.0,1e-6"
+
+        sweep.voltage_sweep_linear(0, 0, 0.1, compliance=0.1)
+        sweep.invalidate()
+        conn.commands.clear()
+        sweep.voltage_sweep_linear(0, 0, 0.1, compliance=0.1)
+
+        assert "*RST" in conn.scpi_commands
+
+
+class TestKeepOutputOn:
+    def test_output_stays_on_between_sweeps(self, sweep_setup):
+        conn, sweep = sweep_setup
+        conn.responses[":FETC?"] = "0.0,1e-6"
+        sweep.set_keep_output_on(True)
+
+        sweep.voltage_sweep_linear(0, 0, 0.1, compliance=0.1)
+        cmds = conn.scpi_commands
+        assert ":OUTP ON" in cmds
+        assert ":OUTP OFF" not in cmds
+
+        conn.commands.clear()
+        sweep.voltage_sweep_linear(0, 0, 0.1, compliance=0.1)
+        cmds = conn.scpi_commands
+        # Output already on -- only re-arm the trigger
+        assert ":OUTP ON" not in cmds
+        assert ":INIT" in cmds
+        assert ":OUTP OFF" not in cmds
+
+    def test_disable_turns_output_off(self, sweep_setup):
+        conn, sweep = sweep_setup
+        conn.responses[":FETC?"] = "0.0,1e-6"
+        sweep.set_keep_output_on(True)
+        sweep.voltage_sweep_linear(0, 0, 0.1, compliance=0.1)
+
+        sweep.set_keep_output_on(False)
+        assert ":OUTP OFF" in conn.scpi_commands
+
+
 class TestParseHelper:
     def test_parse_two_element(self):
         raw = [1.0, 2.0, 3.0, 4.0, 5.0, 6.0]
         result = Sweep._parse_two_element(raw, "a", "b")
-        assert result["a"] == [1.0, 3.0, 5.0]
-        assert result["b"] == [2.0, 4.0, 6.0]
+        assert result["a"] == pytest.approx([1.0, 3.0, 5.0])
+        assert result["b"] == pytest.approx([2.0, 4.0, 6.0])
 
     def test_parse_single_point(self):
         raw = [10.0, 0.001]
         result = Sweep._parse_two_element(raw, "voltage", "current")
-        assert result["voltage"] == [10.0]
-        assert result["current"] == [0.001]
+        assert result["voltage"] == pytest.approx([10.0])
+        assert result["current"] == pytest.approx([0.001])